@@ -764,7 +764,7 @@ class AppOrchestrator:
             visible_variant_indices: Liste der sichtbaren Varianten-Indices (wird für Kompatibilität
                                     akzeptiert, aber ignoriert - Farben basieren immer auf allen Materialien)
         """
-        import matplotlib.pyplot as plt
+        from matplotlib import colormaps
 
         project = self.state.current_project
         if not project or not project.variants:
@@ -779,7 +779,7 @@ class AppOrchestrator:
                     all_materials.add(row.material_name)
 
         # Farben zuweisen (konsistent über alle Diagramme und Sichtbarkeiten)
-        colors = plt.cm.tab20.colors
+        colors = colormaps['tab20'].colors
         self.state.material_colors.clear()
         sorted_materials = sorted(all_materials)
         for idx, material in enumerate(sorted_materials):
@@ -795,8 +795,12 @@ class AppOrchestrator:
         Returns:
             RGB-Tupel (0-1) oder Standardfarbe
         """
-        import matplotlib.pyplot as plt
-        return self.state.material_colors.get(material_name, plt.cm.tab20.colors[0])
+        color = self.state.material_colors.get(material_name)
+        if color is None:
+            # Standardfarbe nur bei unbekanntem Material nachschlagen
+            from matplotlib import colormaps
+            color = colormaps['tab20'].colors[0]
+        return color
 
     def export_pdf(
         self,
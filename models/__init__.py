@@ -3,7 +3,7 @@ Datenmodelle für ABC-CO₂-Bilanzierer
 """
 
 from .project import Project
-from .variant import Variant, MaterialRow
+from .variant import Variant, MaterialRow, boundary_value_getter
 from .material import Material
 
-__all__ = ['Project', 'Variant', 'MaterialRow', 'Material']
+__all__ = ['Project', 'Variant', 'MaterialRow', 'Material', 'boundary_value_getter']
@@ -3,7 +3,8 @@ Varianten-Datenmodell - repräsentiert eine Bauwerksvariante mit Materialzeilen
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from operator import attrgetter
+from typing import Callable, List, Optional, Dict, Any
 from datetime import datetime
 import uuid
 
@@ -79,6 +80,58 @@ class MaterialRow:
         return cls(**data)
 
 
+# Ergebnisfelder je Systemgrenze in Fallback-Reihenfolge:
+# das erste Feld, das nicht None ist, liefert den Wert
+BOUNDARY_RESULT_FIELDS = {
+    # Standard-Deklaration (EN 15804+A2)
+    "A1-A3": ('result_a',),
+    "A1-A3 + C3 + C4": ('result_ac',),
+    "A1-A3 + C3 + C4 + D": ('result_acd', 'result_ac'),
+    # Bio-korrigierte Varianten
+    "A1-A3 (bio)": ('result_a_bio', 'result_a'),
+    "A1-A3 + C3 + C4 (bio)": ('result_ac_bio', 'result_ac'),
+    "A1-A3 + C3 + C4 + D (bio)": ('result_acd_bio', 'result_acd', 'result_ac_bio', 'result_ac'),
+}
+
+
+def boundary_value_getter(boundary: str) -> Callable[[MaterialRow], Optional[float]]:
+    """
+    Erstellt die Funktion row -> CO₂-Wert für eine Systemgrenze
+
+    Die Systemgrenze wird nur einmal aufgelöst (statt String-Vergleichen pro
+    Zeile). Unbekannte Systemgrenzen verhalten sich wie "A1-A3". Das letzte
+    Feld der Kette wird auch als None zurückgegeben.
+
+    Args:
+        boundary: Systemgrenze des Projekts
+
+    Returns:
+        Funktion MaterialRow -> CO₂-Wert in kg
+    """
+    attrs = BOUNDARY_RESULT_FIELDS.get(boundary, BOUNDARY_RESULT_FIELDS["A1-A3"])
+
+    if len(attrs) == 1:
+        return attrgetter(attrs[0])
+
+    if len(attrs) == 2:
+        primary = attrgetter(attrs[0])
+        fallback = attrgetter(attrs[1])
+
+        def resolve(row):
+            value = primary(row)
+            return value if value is not None else fallback(row)
+        return resolve
+
+    get_all = attrgetter(*attrs)
+
+    def resolve_chain(row):
+        for value in get_all(row):
+            if value is not None:
+                return value
+        return value
+    return resolve_chain
+
+
 @dataclass
 class Variant:
     """
@@ -4,13 +4,16 @@ PDF Export Package
 Professional PDF Export für CO₂-Bilanzierung
 """
 
-from .pdf_config import ExportConfig, InfoBlock, PREDEFINED_INFO_BLOCKS, create_default_config
+from .pdf_config import (
+    ExportConfig, InfoBlock, PREDEFINED_INFO_BLOCKS, get_predefined_info_block, create_default_config
+)
 from .pdf_export_pro import PDFExporterPro
 
 __all__ = [
     'ExportConfig',
     'InfoBlock',
     'PREDEFINED_INFO_BLOCKS',
+    'get_predefined_info_block',
     'create_default_config',
     'PDFExporterPro'
 ]
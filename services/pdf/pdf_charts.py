@@ -5,217 +5,528 @@ Erstellt Matplotlib-Diagramme und konvertiert sie in ReportLab-Images:
 - Dashboard-Variantenvergleich (gestapeltes Balkendiagramm)
 - Einzelne Varianten-Diagramme (horizontales Balkendiagramm)
 
-Alle Diagramme werden mit hoher DPI-Qualität und sauberer Formatierung erstellt.
+Alle Diagramme werden mit druckfähiger Auflösung (CHART_DPI) und sauberer Formatierung erstellt.
 """
 
-from models.variant import Variant
+from models.variant import Variant, boundary_value_getter
 from models.project import Project
 from reportlab.lib.units import cm
-from reportlab.platypus import Image as RLImage
-import matplotlib.pyplot as plt
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable
+import functools
 import logging
 import io
+from collections import defaultdict
 from typing import Optional, List
 
-import matplotlib
-matplotlib.use('Agg')  # Headless backend
-
+import numpy as np
+from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Bildformat für eingebettete Diagramme ('PNG' oder 'JPEG')
+# PNG (verlustfrei): Pixel gehen ohne Zwischenkodierung an ReportLab, das sie
+# selbst komprimiert. JPEG wird unverändert ins PDF übernommen und spart ca. 13 ms
+# pro Diagramm, macht das PDF bei flachen Balkendiagrammen aber fast dreimal so
+# groß -> Standard PNG, JPEG pro Export über image_format wählbar
+CHART_IMAGE_FORMAT = 'PNG'
+
+# Rasterauflösung der Export-Diagramme (Figure-DPI)
+# 150 DPI reichen für Balkendiagramme im Druck, 44 % weniger Pixel als mit 200 DPI
+CHART_DPI = 150
+
+# Höchstzahl an Farben für die verlustfreie Palette (8 Bit, siehe _to_rl_image)
+PNG_PALETTE_MAX_COLORS = 256
+
+# Pillow-Speicheroptionen für JPEG
+# Farbsäume an Balkenkanten bei 16 cm Druckbreite nicht sichtbar
+JPEG_SAVE_KWARGS = {'quality': 90, 'optimize': False, 'progressive': False}
+
+# Matplotlib-Konfiguration für PDF-Diagramme (Schriftgrößen/-stil, siehe _with_pdf_colors)
+_MPL_RC_PARAMS = {
+    'font.size': 11,
+    'axes.labelsize': 12,
+    'axes.titlesize': 14,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 9,
+    'figure.titlesize': 14,
+    # 'axes.labelweight': 'bold',
+    'axes.titleweight': 'bold',
+}
+
+# Matplotlib-Stil 'fast': Pfade ab 128 Punkten bis 1 Pixel Abweichung vereinfachen
+# und in Blöcken rastern. Die Balkendiagramme liegen derzeit darunter (kein
+# sichtbarer Unterschied), Kurven/Linien in künftigen Diagrammen profitieren.
+# Nur für PDF-Diagramme (siehe _with_pdf_colors) - GUI-Figuren bleiben unverändert.
+_PDF_PATH_RC_PARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+# PDF-Farben (weißer Hintergrund, schwarze Schrift/Achsen, nur linke/untere Achse).
+# Gilt nur während der Diagramm-Erstellung (siehe _with_pdf_colors), damit das
+# Dark-Theme der GUI unberührt bleibt - die Figuren entstehen direkt PDF-tauglich.
+_PDF_COLOR_RC_PARAMS = {
+    'figure.facecolor': 'white',
+    'axes.facecolor': 'white',
+    'axes.edgecolor': 'black',
+    'axes.labelcolor': 'black',
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'xtick.color': 'black',
+    'ytick.color': 'black',
+    'text.color': 'black',
+    'legend.facecolor': 'white',
+    'legend.edgecolor': 'gray',
+}
+
+# Während der Diagramm-Erstellung aktive rcParams (Schrift, Farben, Pfad-Rasterung).
+# Nur per rc_context, nie global - die GUI-Diagramme behalten ihre eigenen Werte.
+_PDF_RC_CONTEXT = {**_MPL_RC_PARAMS, **_PDF_COLOR_RC_PARAMS, **_PDF_PATH_RC_PARAMS}
+
+
+def _with_pdf_colors(method):
+    """Führt eine Chart-Methode mit den PDF-rcParams (_PDF_RC_CONTEXT) aus"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._lazy_imports()
+        with self._rc_context(_PDF_RC_CONTEXT):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ReaderImage(Flowable):
+    """
+    Bild-Flowable aus einem bereits geöffneten ImageReader
+
+    RLImage akzeptiert nur Dateinamen/Dateiobjekte und baut daraus selbst einen
+    ImageReader. Hier wird der übergebene Reader über die öffentliche Schnittstelle
+    Canvas.drawImage gezeichnet - Bildgröße und dekodierte Daten liegen damit schon
+    beim Erzeugen des Flowables vor, ohne auf RLImage-Interna angewiesen zu sein.
+    """
+
+    def __init__(self, reader: ImageReader, width: float = None, height: float = None,
+                 mask='auto', hAlign='CENTER'):
+        super().__init__()
+        self.reader = reader
+        image_width, image_height = reader.getSize()
+        self.drawWidth = width if width is not None else image_width
+        self.drawHeight = height if height is not None else image_height
+        self.mask = mask
+        self.hAlign = hAlign
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.drawWidth, self.drawHeight,
+                            mask=self.mask)
+
 
 class PDFChartCreator:
     """Erstellt Diagramme für PDF-Export"""
 
-    def __init__(self, project: Project, orchestrator=None):
+    # Matplotlib-Klassen, werden erst beim ersten Diagramm geladen (siehe _lazy_imports)
+    _figure_cls = None
+    _canvas_cls = None
+    _tab20_colors = None
+    _rc_context = None
+
+    def __init__(self, project: Project, orchestrator=None, dpi: int = CHART_DPI,
+                 image_format: str = CHART_IMAGE_FORMAT, vector: bool = False):
         """
         Initialisiert Chart-Creator
 
         Args:
             project: Projekt mit Varianten-Daten
             orchestrator: AppOrchestrator für zentrale Materialfarben
+            dpi: Rasterauflösung der Diagramme
+            image_format: 'PNG' (verlustfrei) oder 'JPEG' (schneller, größeres PDF)
+            vector: Eigene Diagramme als Vektorgrafik einbetten (benötigt svglib)
         """
         self.project = project
         self.orchestrator = orchestrator
+        self.dpi = dpi
+        self.image_format = image_format
+        self.vector = vector
 
-        # Matplotlib-Konfiguration
-        plt.rcParams['font.size'] = 11
-        plt.rcParams['axes.labelsize'] = 12
-        plt.rcParams['axes.titlesize'] = 14
-        plt.rcParams['xtick.labelsize'] = 10
-        plt.rcParams['ytick.labelsize'] = 10
-        plt.rcParams['legend.fontsize'] = 9
-        plt.rcParams['figure.titlesize'] = 14
-        # plt.rcParams['axes.labelweight'] = 'bold'
-        plt.rcParams['axes.titleweight'] = 'bold'
+        # Materialfarben des Orchestrators in diesem Export bereits aktualisiert?
+        self._colors_ready = False
 
-    @staticmethod
-    def figure_to_image(figure, width_cm: float = 16, height_cm: float = 11) -> Optional[RLImage]:
+        # Systemgrenze ist pro Export fest - Wertzugriff nur einmal auflösen
+        self._resolver = boundary_value_getter(project.system_boundary)
+
+        # Bereits gerasterte fremde Figures: (id(figure), Breite, Höhe, Format, DPI) -> (Figure, ImageReader)
+        # Die Figure wird mitgehalten, damit ihre id() nicht neu vergeben wird
+        self._image_cache = {}
+
+    @classmethod
+    def _lazy_imports(cls) -> None:
+        """
+        Lädt Matplotlib beim ersten Diagramm
+
+        Der Import kostet mehrere hundert Millisekunden und wird so nur fällig,
+        wenn tatsächlich Diagramme exportiert werden. Wie in dashboard_view.py
+        und variant_view.py wird die Figure-API ohne pyplot verwendet - die
+        PDF-Figuren landen nicht im globalen pyplot-Zustand der GUI.
+        """
+        if cls._figure_cls is None:
+            import matplotlib
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            cls._tab20_colors = matplotlib.colormaps['tab20'].colors
+            cls._rc_context = staticmethod(matplotlib.rc_context)
+            cls._canvas_cls = FigureCanvasAgg
+            cls._figure_cls = Figure
+
+    def _new_figure(self, width_inch: float, height_inch: float):
+        """
+        Erstellt Figure mit einer Achse und Agg-Canvas (Headless)
+
+        Args:
+            width_inch: Breite in Zoll
+            height_inch: Höhe in Zoll
+
+        Returns:
+            Tuple (Figure, Axes)
+        """
+        self._lazy_imports()
+        fig = self._figure_cls(figsize=(width_inch, height_inch), dpi=self.dpi, facecolor='white')
+        self._canvas_cls(fig)
+        # Eigene Figuren sind bereits PDF-tauglich (weiß/schwarz), figure_to_image
+        # kann die Farbanpassung überspringen
+        fig._pdf_normalized = True
+        return fig, fig.add_subplot()
+
+    def figure_to_image(self, figure, width_cm: float = 16, height_cm: float = 11,
+                        image_format: str = None) -> Optional[Flowable]:
         """
         Konvertiert eine bestehende Matplotlib Figure in ein ReportLab Image
 
+        Gerastert wird mit der Auflösung des Chart-Creators (self.dpi, also
+        ExportConfig.chart_dpi bzw. CHART_DPI). Dieselbe Figure in derselben Größe
+        und Auflösung wird pro Export nur einmal gerastert.
+
         Args:
             figure: Matplotlib Figure
             width_cm: Breite in cm
             height_cm: Höhe in cm
+            image_format: 'PNG' oder 'JPEG' (Standard: self.image_format)
 
         Returns:
             ReportLab Image oder None bei Fehler
         """
-        try:
-            # Figure in BytesIO speichern
-            img_buffer = io.BytesIO()
+        image_format = image_format or self.image_format
+        dpi = self.dpi
+        key = (id(figure), width_cm, height_cm, image_format, dpi)
+        cached = self._image_cache.get(key)
+        if cached is not None:
+            return ReaderImage(cached[1], width=width_cm*cm, height=height_cm*cm)
 
-            # Setze Hintergrund auf weiß für PDF
-            figure.patch.set_facecolor('white')
-            for ax in figure.get_axes():
-                ax.set_facecolor('white')
-                # Textfarben auf schwarz setzen
-                ax.tick_params(colors='black')
-                if ax.xaxis.label:
-                    ax.xaxis.label.set_color('black')
-                if ax.yaxis.label:
-                    ax.yaxis.label.set_color('black')
-                if ax.title:
-                    ax.title.set_color('black')
-                # Spines auf schwarz
-                for spine in ax.spines.values():
-                    if spine.get_visible():
-                        spine.set_color('black')
-                # Legende anpassen
-                legend = ax.get_legend()
-                if legend:
-                    legend.get_frame().set_facecolor('white')
-                    legend.get_frame().set_edgecolor('gray')
-                    for text in legend.get_texts():
-                        text.set_color('black')
+        try:
+            # Farben nur bei fremden Figures (GUI) angleichen, eigene sind bereits weiß
+            if not getattr(figure, '_pdf_normalized', False):
+                PDFChartCreator._normalize_colors(figure)
 
             # WICHTIG: Kein bbox_inches='tight', damit alle Varianten gleich groß sind!
+            # Figure gehört der GUI (eigener Canvas) -> savefig, aber als Rohdaten
+            # statt PNG: ReportLab bekommt die Pixel direkt, ohne Kodieren/Dekodieren
+            raw_buffer = io.BytesIO()
             figure.savefig(
-                img_buffer,
-                format='png',
-                dpi=200,
+                raw_buffer,
+                format='rgba',
+                dpi=dpi,
                 facecolor='white',
                 edgecolor='none'
             )
-            img_buffer.seek(0)
+            width = int(figure.get_figwidth() * dpi)
+            height = raw_buffer.getbuffer().nbytes // (4 * width)
+            img = Image.frombuffer(
+                'RGBA', (width, height), raw_buffer.getbuffer(), 'raw', 'RGBA', 0, 1)
 
-            return RLImage(img_buffer, width=width_cm*cm, height=height_cm*cm)
+            # Weißer Hintergrund -> Pixel sind deckend, auch JPEG ist möglich
+            rl_image = self._to_rl_image(img, width_cm, height_cm, image_format)
+            self._image_cache[key] = (figure, rl_image.reader)
+            return rl_image
 
         except Exception as e:
             logger.error(
                 f"Fehler beim Konvertieren der Figure: {e}", exc_info=True)
             return None
 
+    def clear_image_cache(self) -> None:
+        """Gibt gecachte Bilddaten und Figure-Referenzen frei (nach doc.build)"""
+        self._image_cache.clear()
+
+    @staticmethod
+    def _normalize_colors(figure) -> None:
+        """
+        Setzt Hintergründe auf weiß und Text/Achsen auf schwarz (für GUI-Figures)
+
+        Args:
+            figure: Matplotlib Figure
+        """
+        # Setze Hintergrund auf weiß für PDF
+        figure.patch.set_facecolor('white')
+        for ax in figure.get_axes():
+            ax.set_facecolor('white')
+            # Textfarben auf schwarz setzen
+            ax.tick_params(colors='black')
+            if ax.xaxis.label:
+                ax.xaxis.label.set_color('black')
+            if ax.yaxis.label:
+                ax.yaxis.label.set_color('black')
+            if ax.title:
+                ax.title.set_color('black')
+            # Spines auf schwarz
+            for spine in ax.spines.values():
+                if spine.get_visible():
+                    spine.set_color('black')
+            # Legende anpassen
+            legend = ax.get_legend()
+            if legend:
+                legend.get_frame().set_facecolor('white')
+                legend.get_frame().set_edgecolor('gray')
+                for text in legend.get_texts():
+                    text.set_color('black')
+
+    @staticmethod
+    def _render_image(figure) -> Image.Image:
+        """
+        Rastert eine Figure über ihren Agg-Canvas zu einem Pillow-Bild
+
+        Umgeht print_png/print_jpg von Matplotlib (zusätzliche Buffer-Kopie + Metadaten).
+        Die Auflösung ergibt sich aus figure.dpi.
+
+        Args:
+            figure: Matplotlib Figure mit Agg-Canvas
+
+        Returns:
+            Pillow-Bild (RGB)
+        """
+        canvas = figure.canvas
+        canvas.draw()
+        rgba = canvas.buffer_rgba()
+        height, width = rgba.shape[:2]
+        # Diagramme sind deckend -> Alpha-Kanal verwerfen (sonst SMask im PDF)
+        return Image.frombuffer('RGBA', (width, height), rgba, 'raw', 'RGBA', 0, 1).convert('RGB')
+
+    def _to_flowable(self, figure, width_cm: float, height_cm: float) -> Flowable:
+        """
+        Bettet eine fertige eigene Figure als Vektorgrafik oder Rasterbild ein
+
+        Args:
+            figure: Matplotlib Figure (aus _new_figure)
+            width_cm: Breite in cm
+            height_cm: Höhe in cm
+
+        Returns:
+            ReportLab Drawing (vector=True) oder Image
+        """
+        if self.vector:
+            drawing = self._to_drawing(figure, width_cm, height_cm)
+            if drawing is not None:
+                return drawing
+
+        # Pixel direkt aus dem Agg-Buffer an ReportLab übergeben
+        return self._to_rl_image(
+            self._render_image(figure), width_cm, height_cm, self.image_format)
+
+    def _to_drawing(self, figure, width_cm: float, height_cm: float):
+        """
+        Wandelt eine Figure über SVG in ein ReportLab Drawing (ohne Rasterung)
+
+        Kleinere PDFs und beliebig zoombar, aber langsamer als die Rasterung
+        (SVG-Parsing durch svglib). Ohne svglib wird auf Rasterbilder zurückgefallen.
+
+        Args:
+            figure: Matplotlib Figure
+            width_cm: Breite in cm
+            height_cm: Höhe in cm
+
+        Returns:
+            ReportLab Drawing oder None
+        """
+        try:
+            from svglib.svglib import svg2rlg
+        except ImportError:
+            logger.warning("svglib nicht installiert - Diagramme werden als Bild eingebettet")
+            self.vector = False
+            return None
+
+        svg_buffer = io.BytesIO()
+        figure.savefig(svg_buffer, format='svg', facecolor='white', edgecolor='none')
+        svg_buffer.seek(0)
+        drawing = svg2rlg(svg_buffer)
+        if drawing is None:
+            logger.warning("Diagramm-SVG konnte nicht gelesen werden - Fallback auf Bild")
+            return None
+
+        # Auf Zielgröße skalieren (wie RLImage mit width/height)
+        width, height = width_cm*cm, height_cm*cm
+        drawing.scale(width / drawing.width, height / drawing.height)
+        drawing.width, drawing.height = width, height
+        drawing.hAlign = 'CENTER'
+        return drawing
+
+    @staticmethod
+    def _to_rl_image(img: Image.Image, width_cm: float, height_cm: float,
+                     image_format: str = None) -> ReaderImage:
+        """
+        Übergibt ein gerastertes Diagramm an ReportLab
+
+        PNG: Das Bild geht ohne Farbreduktion direkt an den ImageReader -
+        Materialfarben und Kantenglättung bleiben exakt erhalten. Hat es höchstens
+        PNG_PALETTE_MAX_COLORS Farben, wird es verlustfrei als Palettenbild gehalten
+        (1 statt 3 Byte pro Pixel bis zum Schreiben des PDFs), sonst als RGB.
+        ReportLab liest PNG-Daten ohnehin dekodiert ein und komprimiert sie selbst -
+        eine PNG-Zwischenstufe wäre reines Kodieren und Dekodieren.
+        JPEG: wird kodiert, da ReportLab JPEG-Daten unverändert ins PDF übernimmt.
+
+        Args:
+            img: Pillow-Bild
+            width_cm: Breite in cm
+            height_cm: Höhe in cm
+            image_format: 'PNG' oder 'JPEG' (Standard: CHART_IMAGE_FORMAT)
+
+        Returns:
+            ReportLab Image
+        """
+        image_format = image_format or CHART_IMAGE_FORMAT
+
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        if image_format == 'JPEG':
+            # Eigener Buffer pro Bild: ReportLab liest JPEG-Daten erst beim
+            # Schreiben des PDFs aus dem Dateiobjekt - ein wiederverwendeter
+            # Buffer würde frühere Diagramme überschreiben
+            img_buffer = io.BytesIO()
+            img.save(img_buffer, format='JPEG', **JPEG_SAVE_KWARGS)
+            img_buffer.seek(0)
+            reader = ImageReader(img_buffer)
+        else:
+            # getcolors liefert None, sobald es mehr Farben gibt -> RGB unverändert
+            if img.getcolors(PNG_PALETTE_MAX_COLORS) is not None:
+                img = img.convert('P', palette=Image.Palette.ADAPTIVE,
+                                  colors=PNG_PALETTE_MAX_COLORS)
+            reader = ImageReader(img)
+
+        return ReaderImage(reader, width=width_cm*cm, height=height_cm*cm)
+
     def create_dashboard_chart(
         self,
         variant_indices: List[int],
         width_cm: float = 15.5,
         height_cm: float = 11
-    ) -> Optional[RLImage]:
+    ) -> Optional[Flowable]:
         """
         Erstellt Dashboard-Variantenvergleich (gestapeltes Balkendiagramm)
         Basiert auf der exakten Logik aus dashboard_view.py
 
+        Ohne vorhandene Varianten wird None geliefert, ohne Matplotlib zu laden.
+
         Args:
             variant_indices: Liste der Varianten-Indizes
             width_cm: Breite in cm
             height_cm: Höhe in cm
 
         Returns:
-            ReportLab Image oder None bei Fehler
+            ReportLab Image (Drawing bei vector=True) oder None (keine Varianten/Fehler)
         """
-        try:
-            # Nur ausgewählte Varianten
-            variants = [self.project.variants[i]
-                        for i in variant_indices if i < len(self.project.variants)]
+        # Nur ausgewählte Varianten
+        variants = [self.project.variants[i]
+                    for i in variant_indices if i < len(self.project.variants)]
 
-            if not variants:
-                logger.warning("Keine Varianten für Dashboard-Chart")
-                return None
+        if not variants:
+            logger.warning("Keine Varianten für Dashboard-Chart")
+            return None
 
-            # 1. Alle Materialien über ausgewählte Varianten sammeln
-            all_materials = set()
-            for variant in variants:
-                for row in variant.rows:
-                    if row.material_name:
-                        all_materials.add(row.material_name)
+        return self._plot_dashboard_chart(variants, width_cm, height_cm)
 
-            num_materials = len(all_materials)
+    @_with_pdf_colors
+    def _plot_dashboard_chart(self, variants: List[Variant], width_cm: float,
+                              height_cm: float) -> Optional[Flowable]:
+        """
+        Zeichnet das Dashboard-Diagramm (mit PDF-rcParams, siehe _with_pdf_colors)
 
-            # 2. Zentrale Farbverwaltung aktualisieren (falls Orchestrator vorhanden)
-            if self.orchestrator:
+        Args:
+            variants: Ausgewählte Varianten (nicht leer)
+            width_cm: Breite in cm
+            height_cm: Höhe in cm
+
+        Returns:
+            ReportLab Image (Drawing bei vector=True) oder None bei Fehler
+        """
+        try:
+            # 1. Zentrale Farbverwaltung aktualisieren (falls Orchestrator vorhanden)
+            # Nur einmal pro Export - die Zuordnung hängt nur vom Projekt ab
+            if self.orchestrator and not self._colors_ready:
                 # Aktualisiere mit allen Varianten des Projekts
                 self.orchestrator.update_material_colors()
+                self._colors_ready = True
 
-            # 3. Varianten sammeln - nur tatsächlich vorhandene Materialien
+            # 2. Varianten sammeln - nur tatsächlich vorhandene Materialien
             variant_names = [v.name for v in variants]
             variant_data = []  # Liste von Dictionaries {material_name: value}
 
             for variant in variants:
-                # Materialwerte sammeln (nach Systemgrenze)
-                material_values = {}
+                # Materialwerte sammeln (nach Systemgrenze), kg → t
+                # WICHTIG: Addiere Werte wenn Material mehrfach vorkommt
+                material_values = defaultdict(float)
                 for row in variant.rows:
                     if row.material_name:
-                        val = self._get_value_for_boundary(row)
-                        # kg → t
-                        # WICHTIG: Addiere Werte wenn Material mehrfach vorkommt
-                        if row.material_name in material_values:
-                            material_values[row.material_name] += val / 1000.0
-                        else:
-                            material_values[row.material_name] = val / 1000.0
+                        material_values[row.material_name] += self._resolver(row) / 1000.0
                 variant_data.append(material_values)
 
+            # 3. Alle Materialien über ausgewählte Varianten (ohne zweiten Durchlauf der Zeilen)
+            all_materials = set().union(*variant_data)
+
             # Figure erstellen - noch größer ohne Legende
-            fig, ax = plt.subplots(figsize=(12, 7))
+            # Seitenverhältnis = Zielbild, damit das Diagramm im PDF nicht verzerrt wird
+            # (Breite 10.4 Zoll entspricht dem früheren Ausschnitt mit bbox_inches='tight')
+            fig_width_inch = 10.4
+            fig_height_inch = fig_width_inch * height_cm / width_cm
+            fig, ax = self._new_figure(fig_width_inch, fig_height_inch)
 
             # 4. Gestapeltes Balkendiagramm mit konsistenten Farben
+            # Balken ohne Antialiasing: achsenparallele Kanten brauchen bei Druckauflösung
+            # keine Kantenglättung, Agg spart die Coverage-Berechnung pro Segment
             x_pos = range(len(variant_names))
 
-            # Für jede Variante: Iteriere durch ALLE Materialien (sortiert) für Konsistenz
-            for idx, (name, material_values) in enumerate(zip(variant_names, variant_data)):
-                bottom_positive = 0  # Für positive Werte
-                bottom_negative = 0  # Für negative Werte
-                # WICHTIG: Iteriere durch ALLE Materialien in sortierter Reihenfolge
-                for material_name in sorted(all_materials):
-                    # Hole Wert (0 wenn nicht vorhanden)
-                    value = material_values.get(material_name, 0.0)
-                    if value != 0:  # Zeichne positive UND negative Werte
-                        # Verwende zentrale Farbzuordnung falls vorhanden
-                        if self.orchestrator:
-                            color = self.orchestrator.get_material_color(material_name)
-                        else:
-                            # Fallback: Lokale Farbzuweisung
-                            colors_list = plt.cm.tab20.colors
-                            mat_list = sorted(all_materials)
-                            color = colors_list[mat_list.index(material_name) % len(colors_list)]
-                        if value > 0:
-                            # Positive Werte von unten nach oben stapeln
-                            ax.bar(
-                                idx,
-                                value,
-                                bottom=bottom_positive,
-                                color=color,
-                                edgecolor='white',
-                                linewidth=0.5,
-                                width=0.6
-                            )
-                            bottom_positive += value
-                        else:
-                            # Negative Werte von oben nach unten stapeln
-                            ax.bar(
-                                idx,
-                                value,
-                                bottom=bottom_negative,
-                                color=color,
-                                edgecolor='white',
-                                linewidth=0.5,
-                                width=0.6
-                            )
-                            bottom_negative += value
+            # Farben einmal pro Material auflösen (sortiert für Konsistenz)
+            sorted_materials = sorted(all_materials)
+            color_map = self._material_color_map(sorted_materials)
+
+            # Werte-Matrix Materialien x Varianten (fehlende Materialien = 0)
+            # Nur Nicht-Null-Werte eintragen statt jedes Material je Variante nachzuschlagen
+            material_index = {m: i for i, m in enumerate(sorted_materials)}
+            values = np.zeros((len(sorted_materials), len(variant_names)))
+            for v_idx, material_values in enumerate(variant_data):
+                for material_name, value in material_values.items():
+                    if value != 0:
+                        values[material_index[material_name], v_idx] = value
+
+            # Stapelbasis je Segment: positive Werte von unten nach oben,
+            # negative von oben nach unten (kumulierte Summe der Vorgänger)
+            positive = np.where(values > 0, values, 0.0)
+            negative = np.where(values < 0, values, 0.0)
+            bottom_positive = np.cumsum(positive, axis=0) - positive
+            bottom_negative = np.cumsum(negative, axis=0) - negative
+            bottoms = np.where(values >= 0, bottom_positive, bottom_negative)
+
+            # Alle Segmente (Material x Variante) in einer Collection, Nullwerte auslassen.
+            # Ohne Kantenfarbe entfällt das Nachziehen jeder Rechteckkontur.
+            nonzero = values != 0
+            if nonzero.any():
+                material_idx, variant_idx = np.nonzero(nonzero)
+                self._add_stacked_bars(
+                    ax, variant_idx, bottoms[nonzero], values[nonzero],
+                    [color_map[sorted_materials[m]] for m in material_idx],
+                    width=0.6, edgecolors='none')
 
             # 5. Achsenbeschriftung mit dynamischer Rotation
-            ax.set_xticks(x_pos)
             # Rotation abhängig von Anzahl und Länge der Labels
             max_label_length = max(len(name)
                                    for name in variant_names) if variant_names else 0
@@ -229,9 +540,9 @@ class PDFChartCreator:
                 rotation = 0
                 ha = 'center'
 
-            # X-Achsen-Labels (Variantennamen) ABER kein xlabel
-            ax.set_xticklabels(variant_names, fontsize=15,
-                               rotation=rotation, ha=ha, fontweight='bold')
+            # X-Achsen-Ticks + Labels (Variantennamen) in einem Aufruf, ABER kein xlabel
+            ax.set_xticks(list(x_pos), labels=variant_names, fontsize=15,
+                          rotation=rotation, ha=ha, fontweight='bold')
             ax.set_ylabel('CO2-Äquivalent [t]',
                           fontweight='bold', fontsize=16, labelpad=15)
             # Y-Achsen-Ticks nicht zu groß
@@ -244,41 +555,46 @@ class PDFChartCreator:
 
             # 6. KEINE Legende im PDF Dashboard
 
-            # 7. Spines für PDF (schwarz)
-            ax.spines['bottom'].set_color('black')
-            ax.spines['left'].set_color('black')
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
+            # 7. Spines für PDF (schwarz, nur links/unten) kommen aus _PDF_COLOR_RC_PARAMS
 
             # 8. Layout anpassen - zentriert ohne Legende
-            fig.subplots_adjust(left=0.12, right=0.90, top=0.95, bottom=0.10)
-
-            # In BytesIO speichern
-            img_buffer = io.BytesIO()
-            plt.savefig(
-                img_buffer,
-                format='png',
-                dpi=200,
-                bbox_inches='tight',
-                facecolor='white',
-                edgecolor='none'
-            )
-            img_buffer.seek(0)
-            plt.close(fig)
-
-            return RLImage(img_buffer, width=width_cm*cm, height=height_cm*cm)
+            # Feste Ränder statt bbox_inches='tight' (spart einen kompletten Render-Durchlauf)
+            # Unten so viel Platz, wie die (ggf. gedrehten) Variantennamen brauchen:
+            # nur die Textausdehnung wird gemessen, nicht das ganze Diagramm gerendert
+            renderer = fig.canvas.get_renderer()
+            label_height = max(
+                (label.get_window_extent(renderer).height for label in ax.get_xticklabels()),
+                default=0.0)
+            # + Tick-Länge, Tick-Abstand und etwas Luft (ca. 12 pt)
+            bottom = (label_height + 12 * fig.dpi / 72) / fig.bbox.height
+            bottom = min(max(bottom, 0.10), 0.45)
+            logger.debug(f"Dashboard-Chart: unterer Rand {bottom:.2f} (Rotation {rotation}°)")
+            fig.subplots_adjust(left=0.09, right=0.98, top=0.97, bottom=bottom)
+
+            # Links analog: Platz für Y-Tick-Labels + ylabel (inkl. labelpad) messen.
+            # Der Überstand links der Achse hängt nicht von der Achsenposition ab.
+            y_extent = ax.yaxis.get_tightbbox(renderer)
+            overhang = ax.bbox.x0 - y_extent.x0 if y_extent is not None else 0.0
+            # + etwas Luft zum Bildrand (ca. 6 pt)
+            left = (overhang + 6 * fig.dpi / 72) / fig.bbox.width
+            left = min(max(left, 0.09), 0.30)
+            logger.debug(f"Dashboard-Chart: linker Rand {left:.2f}")
+            fig.subplots_adjust(left=left)
+
+            return self._to_flowable(fig, width_cm, height_cm)
 
         except Exception as e:
             logger.error(
                 f"Fehler beim Erstellen des Dashboard-Charts: {e}", exc_info=True)
             return None
 
+    @_with_pdf_colors
     def create_variant_chart(
         self,
         variant: Variant,
         width_cm: float = 15.5,
         height_cm: float = 9
-    ) -> Optional[RLImage]:
+    ) -> Optional[Flowable]:
         """
         Erstellt Varianten-Diagramm (gestapelter vertikaler Balken mit Legende rechts)
 
@@ -290,7 +606,7 @@ class PDFChartCreator:
             height_cm: Höhe in cm
 
         Returns:
-            ReportLab Image oder None bei Fehler
+            ReportLab Image (Drawing bei vector=True) oder None bei Fehler
         """
         try:
             if not variant.rows:
@@ -299,24 +615,21 @@ class PDFChartCreator:
 
             # WICHTIG: Farben NICHT neu setzen, wenn bereits gesetzt!
             # Die Farben sollten bereits vom Dashboard/GUI gesetzt sein
-            if self.orchestrator and not self.orchestrator.state.material_colors:
+            if (self.orchestrator and not self._colors_ready
+                    and not self.orchestrator.state.material_colors):
                 # Nur wenn noch keine Farben gesetzt sind, setze sie jetzt
                 variant_index = self.project.variants.index(variant) if variant in self.project.variants else 0
                 self.orchestrator.update_material_colors([variant_index])
+                self._colors_ready = True
             
             # Daten sammeln - aggregiere doppelte Materialien
-            material_values = {}
+            material_values = defaultdict(float)
             MAX_NAME_LENGTH = 50  # Maximale Länge für Material-Namen
 
             for row in variant.rows:
                 if row.material_name:
-                    value = self._get_value_for_boundary(
-                        row) / 1000.0  # kg → t
-                    # Addiere Werte wenn Material mehrfach vorkommt
-                    if row.material_name in material_values:
-                        material_values[row.material_name] += value
-                    else:
-                        material_values[row.material_name] = value
+                    # kg → t, addiere Werte wenn Material mehrfach vorkommt
+                    material_values[row.material_name] += self._resolver(row) / 1000.0
 
             # Erstelle Listen mit gekürzten Namen (ALPHABETISCH SORTIERT für konsistente Farben)
             labels = []
@@ -338,49 +651,32 @@ class PDFChartCreator:
             # width_cm/height_cm definieren das Zielbild, figsize sollte proportional sein
             fig_width_inch = width_cm / 2.54  # cm zu inch
             fig_height_inch = height_cm / 2.54
-            fig, ax = plt.subplots(
-                figsize=(fig_width_inch, fig_height_inch), dpi=100, facecolor='white')
-            ax.set_facecolor('white')
+            # Direkt mit Ziel-DPI erstellen (wird ohne savefig gerastert)
+            fig, ax = self._new_figure(fig_width_inch, fig_height_inch)
+
+            # Farben einmal pro Material auflösen (für Balken und Legende)
+            color_map = self._material_color_map(original_names)
 
             # Gestapeltes VERTIKALES Balkendiagramm - positive oben, negative unten
-            bottom_positive = 0  # Für positive Werte (nach oben)
-            bottom_negative = 0  # Für negative Werte (nach unten)
-            
-            for i, (label, value) in enumerate(zip(labels, values)):
-                if value == 0:
-                    continue  # Überspringe Nullwerte
-                
-                # Verwende zentrale Farbzuordnung falls vorhanden
-                original_name = original_names[i]
-                if self.orchestrator:
-                    color = self.orchestrator.get_material_color(original_name)
-                else:
-                    # Fallback: Lokale Farbzuweisung
-                    colors_list = plt.cm.tab20.colors
-                    color = colors_list[i % len(colors_list)]
-                
-                if value > 0:
-                    # Positive Werte von 0 nach oben stapeln
-                    ax.bar(
-                        0,  # X-Position (eine Säule)
-                        value,
-                        bottom=bottom_positive,
-                        width=0.7,
-                        color=color,
-                        edgecolor='white'
-                    )
-                    bottom_positive += value
-                else:
-                    # Negative Werte von 0 nach unten stapeln
-                    ax.bar(
-                        0,  # X-Position (eine Säule)
-                        value,
-                        bottom=bottom_negative,
-                        width=0.7,
-                        color=color,
-                        edgecolor='white'
-                    )
-                    bottom_negative += value
+            # (Balken ohne Antialiasing, siehe create_dashboard_chart)
+            # Alle Segmente der Säule in einer Collection, Nullwerte auslassen
+            value_array = np.asarray(values, dtype=float)
+            positive = np.where(value_array > 0, value_array, 0.0)
+            negative = np.where(value_array < 0, value_array, 0.0)
+            bottoms = np.where(value_array >= 0,
+                               np.cumsum(positive) - positive,
+                               np.cumsum(negative) - negative)
+            nonzero = value_array != 0
+            if nonzero.any():
+                self._add_stacked_bars(
+                    ax,
+                    np.zeros(int(nonzero.sum())),  # X-Position (eine Säule)
+                    bottoms[nonzero],
+                    value_array[nonzero],
+                    [color_map[name] for name, keep in zip(original_names, nonzero) if keep],
+                    width=0.7,
+                    edgecolors='white'
+                )
 
             # Achsen - KEIN Titel mehr
             ax.set_ylabel(
@@ -397,17 +693,10 @@ class PDFChartCreator:
             from matplotlib.patches import Rectangle
             legend_handles = []
             legend_labels_list = []
-            for material_name in sorted(original_names):
-                if self.orchestrator:
-                    color = self.orchestrator.get_material_color(material_name)
-                else:
-                    colors_list = plt.cm.tab20.colors
-                    sorted_names = sorted(original_names)
-                    color = colors_list[sorted_names.index(material_name) % len(colors_list)]
-                patch = Rectangle((0, 0), 1, 1, fc=color, edgecolor='white')
+            # original_names ist bereits sortiert, labels enthält die gekürzten Namen
+            for material_name, display_name in zip(original_names, labels):
+                patch = Rectangle((0, 0), 1, 1, fc=color_map[material_name], edgecolor='white')
                 legend_handles.append(patch)
-                # Kürze Namen wenn nötig
-                display_name = material_name if len(material_name) <= MAX_NAME_LENGTH else material_name[:MAX_NAME_LENGTH-3] + "..."
                 legend_labels_list.append(display_name)
             
             # Legende rechts neben dem Diagramm - OHNE Rahmen
@@ -423,68 +712,80 @@ class PDFChartCreator:
             )
 
             # Spines - kein Rahmen um reines Diagramm (Rahmen kommt von ReportLab Table)
-            ax.spines['bottom'].set_color('black')
-            ax.spines['left'].set_color('black')
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.tick_params(colors='black')
-            ax.yaxis.label.set_color('black')
+            # Farben und sichtbare Achsen kommen aus _PDF_COLOR_RC_PARAMS
 
             # Layout anpassen - mehr Canvas wie beim Dashboard
             # Links mehr Platz für Y-Achse, rechts weniger für Legende (kompakter)
             fig.subplots_adjust(left=0.12, right=0.30, top=0.95, bottom=0.10)
 
-            # In BytesIO speichern
             # WICHTIG: Kein bbox_inches='tight', damit alle Varianten gleich groß sind!
-            img_buffer = io.BytesIO()
-            fig.savefig(
-                img_buffer,
-                format='png',
-                dpi=200,
-                facecolor='white',
-                edgecolor='none'
-            )
-            img_buffer.seek(0)
-            plt.close(fig)
-
-            return RLImage(img_buffer, width=width_cm*cm, height=height_cm*cm)
+            return self._to_flowable(fig, width_cm, height_cm)
 
         except Exception as e:
             logger.error(
                 f"Fehler beim Erstellen des Varianten-Charts: {e}", exc_info=True)
             return None
 
-    def _get_value_for_boundary(self, row) -> float:
+    @staticmethod
+    def _add_stacked_bars(ax, x, bottoms, heights, colors, width: float, **kwargs):
         """
-        Holt korrekten CO₂-Wert basierend auf Systemgrenze
-        WICHTIG: Muss identisch mit dashboard_view.py sein!
+        Zeichnet Balkensegmente als eine PolyCollection statt über ax.bar
+
+        ax.bar legt pro Segment ein Rectangle-Patch samt Transform und
+        Autoscale-Aktualisierung an; die Collection wird direkt aus den
+        NumPy-Arrays gebaut und von Agg in einem Durchgang gezeichnet.
 
         Args:
-            row: MaterialRow
+            ax: Matplotlib Axes
+            x: Mittelpunkte der Balken
+            bottoms: Untere Kante je Segment
+            heights: Höhe je Segment (negativ = nach unten)
+            colors: Füllfarbe je Segment
+            width: Balkenbreite
+            **kwargs: Weitere PolyCollection-Optionen (z.B. edgecolors)
 
         Returns:
-            CO₂-Wert in kg
+            PolyCollection
         """
-        boundary = self.project.system_boundary
-        
-        # Standard-Deklaration (EN 15804+A2)
-        if boundary == "A1-A3":
-            return row.result_a
-        elif boundary == "A1-A3 + C3 + C4":
-            return row.result_ac
-        elif boundary == "A1-A3 + C3 + C4 + D":
-            return row.result_acd if row.result_acd is not None else row.result_ac
-        # Bio-korrigierte Varianten
-        elif boundary == "A1-A3 (bio)":
-            return row.result_a_bio if row.result_a_bio is not None else row.result_a
-        elif boundary == "A1-A3 + C3 + C4 (bio)":
-            return row.result_ac_bio if row.result_ac_bio is not None else row.result_ac
-        elif boundary == "A1-A3 + C3 + C4 + D (bio)":
-            if row.result_acd_bio is not None:
-                return row.result_acd_bio
-            elif row.result_acd is not None:
-                return row.result_acd
-            else:
-                return row.result_ac_bio if row.result_ac_bio is not None else row.result_ac
-        # Fallback
-        return row.result_a
+        from matplotlib.collections import PolyCollection
+
+        x = np.asarray(x, dtype=float)
+        bottoms = np.asarray(bottoms, dtype=float)
+        tops = bottoms + np.asarray(heights, dtype=float)
+        left = x - width / 2
+        right = x + width / 2
+        # Eckpunkte je Segment: (N, 4, 2)
+        verts = np.stack([
+            np.column_stack([left, bottoms]),
+            np.column_stack([left, tops]),
+            np.column_stack([right, tops]),
+            np.column_stack([right, bottoms]),
+        ], axis=1)
+
+        # Balken ohne Antialiasing (siehe create_dashboard_chart)
+        collection = PolyCollection(verts, facecolors=colors, antialiased=False, **kwargs)
+        # Wie ax.bar: Balkenbasis als feste Kante, damit die Y-Achse bei
+        # rein positiven Werten ohne Rand bei 0 beginnt
+        collection.sticky_edges.y.extend(bottoms.tolist())
+        ax.add_collection(collection)
+        ax.autoscale_view()
+        return collection
+
+    def _material_color_map(self, sorted_names: List[str]) -> dict:
+        """
+        Löst die Farben aller Materialien eines Diagramms einmalig auf
+
+        Args:
+            sorted_names: Alphabetisch sortierte Material-Namen
+
+        Returns:
+            Dictionary {material_name: color}
+        """
+        if self.orchestrator:
+            # Zentrale Farbzuordnung
+            get_color = self.orchestrator.get_material_color
+            return {name: get_color(name) for name in sorted_names}
+
+        # Fallback: Lokale Farbzuweisung nach sortierter Position
+        colors_list = self._tab20_colors
+        return {name: colors_list[i % len(colors_list)] for i, name in enumerate(sorted_names)}
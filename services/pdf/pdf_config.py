@@ -6,8 +6,9 @@ Definiert die Datenstrukturen für:
 - Export-Konfiguration (was soll exportiert werden)
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Iterator, Optional, List, Dict
 
 
 @dataclass
@@ -61,13 +62,19 @@ class ExportConfig:
     include_variant_charts: bool = True
     include_variant_tables: bool = True
 
+    # ===== DIAGRAMME =====
+    # Diagramme als Vektorgrafik statt als Bild einbetten (kleineres PDF, benötigt svglib)
+    vector_charts: bool = False
+    # Rasterauflösung der Diagramme (None = CHART_DPI); z.B. 100 für kleine Entwurfs-PDFs
+    chart_dpi: Optional[int] = None
+
     # ===== KOMMENTARE =====
     # Dictionary: variant_index -> Kommentar-Text
     # Kommentare werden als Text-Block unter der Varianten-Überschrift eingefügt
     comments: Dict[int, str] = field(default_factory=dict)
 
     # ===== INFO-BLÖCKE =====
-    # Liste von Info-Blöcken (Methodik, Projektbeschreibung, etc.)
+    # Liste von Info-Blöcken (Methodik, Projektbeschreibung, etc.), eine ID je Block
     # Diese werden am Anfang oder Ende des PDFs eingefügt
     info_blocks: List[InfoBlock] = field(default_factory=list)
 
@@ -89,16 +96,13 @@ class ExportConfig:
 
     def add_info_block(self, info_block: InfoBlock):
         """Fügt einen Info-Block hinzu"""
-        # Prüfe, ob Block mit dieser ID bereits existiert
-        existing = next(
-            (ib for ib in self.info_blocks if ib.id == info_block.id), None)
-        if existing:
-            # Ersetze bestehenden Block
-            idx = self.info_blocks.index(existing)
-            self.info_blocks[idx] = info_block
-        else:
-            # Füge neuen Block hinzu
-            self.info_blocks.append(info_block)
+        # Block mit gleicher ID wird an seiner bisherigen Position ersetzt
+        # (ein Durchlauf statt Suchen + index())
+        for idx, existing in enumerate(self.info_blocks):
+            if existing.id == info_block.id:
+                self.info_blocks[idx] = info_block
+                return
+        self.info_blocks.append(info_block)
 
     def remove_info_block(self, block_id: str):
         """Entfernt einen Info-Block"""
@@ -110,9 +114,32 @@ class ExportConfig:
 
 
 # ===== VORDEFINIERTE INFO-BLÖCKE =====
-# Diese können in der Anwendung verwendet werden
+# Diese können in der Anwendung verwendet werden.
+# Jeder Zugriff liefert eine Kopie - die Vorlagen selbst bleiben unverändert.
+
+class _PredefinedInfoBlocks(Mapping):
+    """
+    Nur-Lese-Mapping der vordefinierten Info-Blöcke
+
+    InfoBlock ist veränderbar (z.B. include=True im Export-Dialog). Damit
+    Änderungen nicht die Vorlagen für spätere Exporte verfälschen, gibt jeder
+    Zugriff (auch über items()/values()/get()) eine eigene Kopie zurück.
+    """
+
+    def __init__(self, blocks: Dict[str, InfoBlock]):
+        self._blocks = dict(blocks)
+
+    def __getitem__(self, block_id: str) -> InfoBlock:
+        return self._blocks[block_id].copy()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._blocks)
+
+    def __len__(self) -> int:
+        return len(self._blocks)
 
-PREDEFINED_INFO_BLOCKS = {
+
+PREDEFINED_INFO_BLOCKS = _PredefinedInfoBlocks({
     "methodik": InfoBlock(
         id="methodik",
         title="Methodik",
@@ -150,7 +177,20 @@ PREDEFINED_INFO_BLOCKS = {
         image_path=None,
         include=False
     )
-}
+})
+
+
+def get_predefined_info_block(block_id: str) -> Optional[InfoBlock]:
+    """
+    Liefert eine Kopie eines vordefinierten Info-Blocks
+
+    Args:
+        block_id: ID des Blocks (z.B. "methodik")
+
+    Returns:
+        Eigene InfoBlock-Instanz oder None, wenn die ID unbekannt ist
+    """
+    return PREDEFINED_INFO_BLOCKS.get(block_id)
 
 
 def create_default_config() -> ExportConfig:
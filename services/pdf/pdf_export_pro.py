@@ -18,23 +18,40 @@ Verwendung:
 import logging
 import subprocess
 from pathlib import Path
+from typing import BinaryIO, Union
 
+from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import cm
+from reportlab.lib.utils import ImageReader
 from reportlab.platypus import (
     BaseDocTemplate, PageTemplate, Frame,
-    Paragraph, Spacer, PageBreak
+    Paragraph, Spacer, PageBreak,
+    Table as RLTable, TableStyle
 )
 
 from models.project import Project
 from services.pdf.pdf_config import ExportConfig, InfoBlock
 from services.pdf.pdf_styles import get_styles
-from services.pdf.pdf_charts import PDFChartCreator
+from services.pdf.pdf_charts import CHART_DPI, PDFChartCreator, ReaderImage
 from services.pdf.pdf_tables import PDFTableCreator
 from services.pdf.pdf_header_footer import PDFHeaderFooter
 
 logger = logging.getLogger(__name__)
 
+# Anzeigegrößen (Breite, Höhe) der Bilder im PDF
+INFO_IMAGE_SIZE = (12*cm, 8*cm)
+ADDITIONAL_IMAGE_SIZE = (15*cm, 10*cm)
+
+# Rahmen um die Diagramme (einmalig auf Modulebene, setStyle liest den Style nur)
+_CHART_FRAME_STYLE = TableStyle([
+    ('BOX', (0, 0), (-1, -1), 0.5, colors.black),  # Dünner Rahmen
+    ('LEFTPADDING', (0, 0), (-1, -1), 5),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+])
+
 
 class PDFExporterPro:
     """
@@ -52,11 +69,15 @@ class PDFExporterPro:
         self.table_creator = None
         self.header_footer = None
 
+        # Info-/Zusatzbilder über Exporte hinweg: (Pfad, mtime_ns) -> ImageReader
+        # Enthält nur Bilder der aktuellen Konfiguration (siehe export)
+        self._image_reader_cache = {}
+
     def export(
         self,
         project: Project,
         config: ExportConfig,
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         dashboard_figure=None,
         variant_figures: dict = None,
         orchestrator=None
@@ -67,7 +88,8 @@ class PDFExporterPro:
         Args:
             project: Projekt-Daten
             config: Export-Konfiguration
-            output_path: Zieldatei-Pfad
+            output_path: Zieldatei-Pfad oder beschreibbarer Binär-Stream (z.B. BytesIO).
+                Bei einem Stream wird das PDF nur hineingeschrieben, nicht geöffnet.
             dashboard_figure: Bestehende Dashboard-Figure (optional)
             variant_figures: Dict {variant_idx: Figure} (optional)
             orchestrator: AppOrchestrator für zentrale Materialfarben (optional)
@@ -85,8 +107,17 @@ class PDFExporterPro:
             self.config = config
             self.dashboard_figure = dashboard_figure
             self.variant_figures = variant_figures
+            self._image_mtimes = self._stat_image_paths(config)
+            # Reader für nicht mehr verwendete oder geänderte Dateien verwerfen -
+            # der Cache bleibt so auf die Bilder einer Konfiguration begrenzt
+            self._image_reader_cache = {
+                key: reader for key, reader in self._image_reader_cache.items()
+                if self._image_mtimes.get(key[0]) == key[1]
+            }
             self.styles = get_styles()
-            self.chart_creator = PDFChartCreator(project, orchestrator)
+            self.chart_creator = PDFChartCreator(
+                project, orchestrator, dpi=config.chart_dpi or CHART_DPI,
+                vector=config.vector_charts)
             self.table_creator = PDFTableCreator(project)
             self.header_footer = PDFHeaderFooter(project, config)
 
@@ -101,7 +132,10 @@ class PDFExporterPro:
                 rightMargin=2*cm,
                 leftMargin=2*cm,
                 topMargin=self.header_footer.get_heading_position_from_top(FIXED_DISTANCE_BELOW_LINE),
-                bottomMargin=2.5*cm  # Mehr Platz für Footer
+                bottomMargin=2.5*cm,  # Mehr Platz für Footer
+                # Seiteninhalte mit zlib komprimieren - unabhängig von lokalen
+                # ReportLab-Einstellungen (rl_config.pageCompression)
+                pageCompression=1
             )
 
             # Frame für Inhalt
@@ -128,14 +162,20 @@ class PDFExporterPro:
             # PDF bauen
             doc.build(story)
 
+            # Bilder liegen jetzt im PDF - dekodierte Diagramme nicht länger halten
+            # als nötig (Exporter und Chart-Creator leben über den Export hinaus)
+            del story
+            self.chart_creator.clear_image_cache()
+
             logger.info(f"PDF erfolgreich erstellt: {output_path}")
 
-            # PDF automatisch öffnen (macOS)
-            try:
-                subprocess.run(['open', output_path], check=False)
-                logger.info(f"PDF geöffnet: {output_path}")
-            except Exception as e:
-                logger.warning(f"Konnte PDF nicht öffnen: {e}")
+            # PDF automatisch öffnen (macOS) - nur bei einer Datei
+            if isinstance(output_path, (str, Path)):
+                try:
+                    subprocess.run(['open', output_path], check=False)
+                    logger.info(f"PDF geöffnet: {output_path}")
+                except Exception as e:
+                    logger.warning(f"Konnte PDF nicht öffnen: {e}")
 
             return True
 
@@ -160,11 +200,15 @@ class PDFExporterPro:
         ))
         story.append(Spacer(1, 0.5*cm))
 
-        # ===== INFO-BLÖCKE AM ANFANG =====
-        # Nur Methodik kommt am Anfang
+        # Info-Blöcke einmal aufteilen: Methodik kommt an den Anfang, alle anderen ans Ende
+        start_blocks, end_blocks = [], []
         for info_block in self.config.info_blocks:
-            if info_block.include and info_block.id == "methodik":
-                story.extend(self._build_info_block(info_block))
+            if info_block.include:
+                (start_blocks if info_block.id == "methodik" else end_blocks).append(info_block)
+
+        # ===== INFO-BLÖCKE AM ANFANG =====
+        for info_block in start_blocks:
+            story.extend(self._build_info_block(info_block))
 
         # ===== DASHBOARD =====
         if self.config.include_dashboard:
@@ -176,14 +220,12 @@ class PDFExporterPro:
                 story.extend(self._build_variant_section(variant_idx))
 
         # ===== INFO-BLÖCKE AM ENDE =====
-        # Alle außer Methodik kommen ans Ende
-        for info_block in self.config.info_blocks:
-            if info_block.include and info_block.id != "methodik":
-                story.extend(self._build_info_block(info_block))
+        for info_block in end_blocks:
+            story.extend(self._build_info_block(info_block))
 
         # ===== ZUSATZBILD =====
         if self.config.additional_image_path:
-            if Path(self.config.additional_image_path).exists():
+            if self.config.additional_image_path in self._image_mtimes:
                 story.extend(self._build_additional_image())
 
         return story
@@ -198,27 +240,19 @@ class PDFExporterPro:
         # elements.append(Spacer(1, 0.3*cm))
 
         # Diagramm - IMMER neu erstellen für PDF-spezifische Formatierung
+        # (None ohne ausgewählte Varianten - dann wird Matplotlib gar nicht geladen)
         if self.config.include_dashboard_chart:
             chart = self.chart_creator.create_dashboard_chart(
                 self.config.include_variants
             )
-            logger.info("Erstelle neues Dashboard-Chart für PDF")
+            logger.debug("Erstelle neues Dashboard-Chart für PDF")
 
             if chart:
                 # Rahmen um das Chart (etwas schmaler als Tabelle)
-                from reportlab.platypus import Table as RLTable, TableStyle
-                from reportlab.lib import colors
-
                 # Chart in 1x1 Tabelle einpacken für Rahmen
                 # Breiter für größeres Chart
                 chart_table = RLTable([[chart]], colWidths=[16*cm])
-                chart_table.setStyle(TableStyle([
-                    ('BOX', (0, 0), (-1, -1), 0.5, colors.black),  # Dünner Rahmen
-                    ('LEFTPADDING', (0, 0), (-1, -1), 5),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-                    ('TOPPADDING', (0, 0), (-1, -1), 5),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-                ]))
+                chart_table.setStyle(_CHART_FRAME_STYLE)
                 elements.append(chart_table)
                 elements.append(Spacer(1, 0.5*cm))
 
@@ -268,27 +302,20 @@ class PDFExporterPro:
             #     logger.info(
             #         f"Verwende bestehende Figure für Variante {variant_idx}")
             # else:
+            # Bewusst im Haupt-Thread ohne Pool - ein Prozess-Pool kostet beim Start
+            # mehr als alle Diagramme zusammen (siehe PDF_EXPORT_DOKUMENTATION.md)
             chart = self.chart_creator.create_variant_chart(
                 variant,
                 width_cm=CHART_WIDTH,
                 height_cm=CHART_HEIGHT
             )
-            logger.info(f"Erstelle neue Figure für Variante {variant_idx}")
+            logger.debug(f"Erstelle neue Figure für Variante {variant_idx}")
 
             if chart:
                 # Rahmen um das Chart (schmaler als Tabelle)
-                from reportlab.platypus import Table as RLTable, TableStyle
-                from reportlab.lib import colors
-
                 # Chart in 1x1 Tabelle einpacken für Rahmen
                 chart_table = RLTable([[chart]], colWidths=[16*cm])
-                chart_table.setStyle(TableStyle([
-                    ('BOX', (0, 0), (-1, -1), 0.5, colors.black),  # Dünner Rahmen
-                    ('LEFTPADDING', (0, 0), (-1, -1), 5),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-                    ('TOPPADDING', (0, 0), (-1, -1), 5),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-                ]))
+                chart_table.setStyle(_CHART_FRAME_STYLE)
                 elements.append(chart_table)
                 elements.append(Spacer(1, 0.5*cm))  # Mehr Abstand
 
@@ -320,10 +347,9 @@ class PDFExporterPro:
             elements.append(Spacer(1, 0.3*cm))
 
         # Bild
-        if info_block.image_path and Path(info_block.image_path).exists():
+        if info_block.image_path and info_block.image_path in self._image_mtimes:
             try:
-                from reportlab.platypus import Image as RLImage
-                img = RLImage(info_block.image_path, width=12*cm, height=8*cm)
+                img = self._cached_image(info_block.image_path, *INFO_IMAGE_SIZE)
                 elements.append(img)
                 elements.append(Spacer(1, 0.3*cm))
             except Exception as e:
@@ -342,11 +368,55 @@ class PDFExporterPro:
         elements.append(Spacer(1, 0.3*cm))
 
         try:
-            from reportlab.platypus import Image as RLImage
-            img = RLImage(self.config.additional_image_path,
-                          width=15*cm, height=10*cm)
+            img = self._cached_image(self.config.additional_image_path, *ADDITIONAL_IMAGE_SIZE)
             elements.append(img)
         except Exception as e:
             logger.warning(f"Zusatzbild konnte nicht geladen werden: {e}")
 
         return elements
+
+    @staticmethod
+    def _stat_image_paths(config: ExportConfig) -> dict:
+        """
+        Prüft alle Bildpfade der Konfiguration einmal (ein stat pro Datei)
+
+        Args:
+            config: Export-Konfiguration
+
+        Returns:
+            Dict {Pfad: mtime_ns} der existierenden Bilddateien
+        """
+        candidate_paths = [config.additional_image_path]
+        candidate_paths.extend(ib.image_path for ib in config.info_blocks)
+
+        image_mtimes = {}
+        for image_path in candidate_paths:
+            if image_path and image_path not in image_mtimes:
+                try:
+                    image_mtimes[image_path] = Path(image_path).stat().st_mtime_ns
+                except OSError:
+                    pass  # Datei fehlt -> Bild wird übersprungen
+        return image_mtimes
+
+    def _cached_image(self, image_path: str, width: float, height: float) -> ReaderImage:
+        """
+        Erstellt ein Bild-Flowable aus einem gecachten ImageReader
+
+        Pro Datei gibt es einen ImageReader: Mehrfach verwendete Bilder werden nur
+        einmal eingebettet, und bei wiederholten Exporten wird die Datei nicht erneut
+        gelesen, solange sie sich nicht ändert. Die Bilddaten bleiben unverändert.
+
+        Args:
+            image_path: Pfad zum Bild
+            width: Zielbreite in Punkten
+            height: Zielhöhe in Punkten
+
+        Returns:
+            ReportLab Image
+        """
+        key = (image_path, self._image_mtimes[image_path])
+        reader = self._image_reader_cache.get(key)
+        if reader is None:
+            reader = ImageReader(image_path)
+            self._image_reader_cache[key] = reader
+        return ReaderImage(reader, width=width, height=height)
@@ -16,9 +16,14 @@ FOOTER:
 """
 
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Optional
 
+from PIL import Image
+from reportlab.graphics import renderPDF
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import cm
 from reportlab.lib import colors
@@ -29,10 +34,71 @@ from services.pdf.pdf_config import ExportConfig
 
 logger = logging.getLogger(__name__)
 
+# ===== LAYOUT-KONSTANTEN (in Punkten) =====
+PAGE_WIDTH, PAGE_HEIGHT = A4
+LEFT_MARGIN = 2*cm
+RIGHT_MARGIN = 2*cm
+BOTTOM_MARGIN = 2.5*cm
+RIGHT_X = PAGE_WIDTH - RIGHT_MARGIN
+
+# Header
+HEADER_TOP_OFFSET = 1.5*cm                 # Logo und Projektname: Abstand vom oberen Rand
+HEADER_TOP_Y = PAGE_HEIGHT - HEADER_TOP_OFFSET
+PROJECT_NAME_Y = HEADER_TOP_Y - 0.3*cm     # Leicht nach unten versetzt für optische Ausrichtung
+META_MIN_OFFSET = 1.3*cm                   # Mindestabstand Metadaten zum Projektnamen
+META_LOGO_GAP = 0.3*cm                     # Abstand Metadaten unter dem Logo
+META_LINE_GAP = 0.4*cm                     # Zeilenabstand Datum -> Systemgrenze
+HEADER_LINE_GAP = 0.5*cm                   # Trennlinie unter der letzten Metadaten-Zeile
+LOGO_MAX_WIDTH = 4*cm
+LOGO_MAX_HEIGHT = 2.5*cm
+
+# Footer
+FOOTER_LINE_Y = 2.3*cm
+PAGE_NUMBER_Y = 1.8*cm
+DISCLAIMER_Y = 1.8*cm
+DISCLAIMER_LEADING = 0.3*cm
+DISCLAIMER_MAX_WIDTH = 12*cm
+
+# Name des Form-XObjects mit dem seitenunabhängigen Header/Footer
+STATIC_FORM_NAME = 'pdf_header_footer'
+
+
+@lru_cache(maxsize=4096)
+def _word_width(word: str, font_name: str, font_size: float) -> float:
+    """Breite eines Wortes in Punkten (gecacht - der Disclaimer wiederholt sich pro Export)"""
+    return stringWidth(word, font_name, font_size)
+
+
+@dataclass
+class _LogoInfo:
+    """
+    Einmal geladenes und skaliertes Logo
+
+    Attributes:
+        kind: 'svg' oder 'raster'
+        orig_width: Originalbreite (Punkte bzw. Pixel)
+        orig_height: Originalhöhe (Punkte bzw. Pixel)
+        scale: Skalierungsfaktor auf max. 4cm x 2.5cm
+        actual_width: Gezeichnete Breite in Punkten
+        actual_height: Gezeichnete Höhe in Punkten
+        drawing: Bereits skalierte SVG-Drawing (nur bei 'svg')
+    """
+    kind: str
+    orig_width: float
+    orig_height: float
+    scale: float
+    actual_width: float
+    actual_height: float
+    drawing: Optional[Any] = None
+
 
 class PDFHeaderFooter:
     """Zeichnet Header und Footer auf PDF-Seiten"""
 
+    # Geparste SVG-Logos über Exporte hinweg: (Pfad, mtime_ns) -> _LogoInfo
+    # svg2rlg ist der teuerste Schritt beim Logo; das Logo wechselt selten
+    _svg_logo_cache = {}
+
     def __init__(self, project: Project, config: ExportConfig):
         """
         Initialisiert Header/Footer-Renderer
@@ -45,125 +111,128 @@ class PDFHeaderFooter:
         self.config = config
 
         # Layout-Konstanten
-        self.page_width = A4[0]
-        self.page_height = A4[1]
-        self.left_margin = 2*cm
-        self.right_margin = 2*cm
-        self.bottom_margin = 2.5*cm
-
-        # Linienposition vorausberechnen (bevor Header gezeichnet wird)
-        self.header_line_y = self._precalculate_line_position()
-        
-        # Top-Margin dynamisch berechnen basierend auf Linienposition
-        self.top_margin = self._calculate_top_margin()
-
-    def _precalculate_line_position(self) -> float:
+        self.page_width = PAGE_WIDTH
+        self.page_height = PAGE_HEIGHT
+        self.left_margin = LEFT_MARGIN
+        self.right_margin = RIGHT_MARGIN
+        self.bottom_margin = BOTTOM_MARGIN
+
+        # Kopfzeilen-Texte einmal pro Export (gleiches Datum auf allen Seiten)
+        self._date_str = f"Datum: {datetime.now().strftime('%d.%m.%Y')}"
+        self._sysbound_str = f"Systemgrenze: {self.project.system_boundary}"
+
+        # Rechtsbündige X-Positionen der festen Texte (spart stringWidth pro Seite)
+        self._project_name_x = RIGHT_X - stringWidth(self.project.name, 'Helvetica-Bold', 16)
+        self._date_x = RIGHT_X - stringWidth(self._date_str, 'Helvetica', 9)
+        self._sysbound_x = RIGHT_X - stringWidth(self._sysbound_str, 'Helvetica', 9)
+
+        # Logo einmal laden/vermessen - wird von allen Seiten wiederverwendet
+        self._logo = self._load_logo_once()
+
+        # Linienposition (bevor Header gezeichnet wird) und Top-Margin vorausberechnen
+        layout = self._compute_header_layout()
+        self.header_line_y = layout['line_y']
+        self._date_y = layout['date_y']
+        self._sysbound_y = layout['sysbound_y']
+        self.top_margin = layout['top_margin']
+
+        # Disclaimer einmal umbrechen (max. 12 cm breit) - ist auf jeder Seite gleich
+        self._disclaimer_lines = self._wrap_text(
+            self.config.disclaimer,
+            'Helvetica',
+            7,
+            DISCLAIMER_MAX_WIDTH
+        ) if self.config.disclaimer else []
+
+        # Statischer Header/Footer wird beim ersten Seitenaufruf als Form-XObject angelegt
+        self._static_form_ready = False
+
+    def _load_logo_once(self) -> Optional[_LogoInfo]:
         """
-        Berechnet die Y-Position der horizontalen Trennlinie BEVOR der Header gezeichnet wird
-        Verwendet die EXAKT GLEICHE Logik wie _draw_header
-        
+        Lädt das Logo einmalig und berechnet die Skalierung (max. 4cm x 2.5cm)
+
         Returns:
-            Y-Position der Linie in Punkten
+            _LogoInfo oder None, wenn kein (gültiges) Logo vorhanden ist
         """
-        top_start = self.page_height - 1.5*cm
-        
-        # Logo-Höhe berechnen (falls vorhanden)
-        logo_height = 0
-        if self.config.logo_path and Path(self.config.logo_path).exists():
-            try:
-                if self.config.logo_path.lower().endswith('.svg'):
-                    from svglib.svglib import svg2rlg
-                    drawing = svg2rlg(self.config.logo_path)
-                    if drawing:
-                        orig_width = drawing.width
-                        orig_height = drawing.height
-                        max_width = 4*cm
-                        max_height = 2.5*cm
-                        width_scale = max_width / orig_width
-                        height_scale = max_height / orig_height
-                        scale = min(width_scale, height_scale)
-                        actual_height = orig_height * scale
-                        logo_height = actual_height
-                else:
-                    from PIL import Image
-                    img = Image.open(self.config.logo_path)
+        if not (self.config.logo_path and Path(self.config.logo_path).exists()):
+            return None
+
+        logo_path = Path(self.config.logo_path)
+        try:
+            drawing = None
+            cache_key = None
+            if logo_path.suffix.lower() == '.svg':
+                # Gleiche, unveränderte Datei wurde schon einmal geparst und skaliert
+                cache_key = (str(logo_path), logo_path.stat().st_mtime_ns)
+                cached = self._svg_logo_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                # SVG mit svglib/reportlab - svglib ist optional und braucht ~50 ms
+                # zum Importieren, daher erst hier (nur bei SVG-Logo, einmal pro Datei)
+                from svglib.svglib import svg2rlg
+
+                drawing = svg2rlg(str(logo_path))
+                if not drawing:
+                    logger.warning(f"SVG konnte nicht geladen werden: {logo_path}")
+                    return None
+                kind = 'svg'
+                orig_width, orig_height = drawing.width, drawing.height
+            else:
+                # Raster-Bild (PNG, JPG, etc.) - nur Header lesen für die Abmessungen
+                with Image.open(self.config.logo_path) as img:
                     orig_width, orig_height = img.size
-                    max_width = 4*cm
-                    max_height = 2.5*cm
-                    width_scale = max_width / orig_width
-                    height_scale = max_height / orig_height
-                    scale = min(width_scale, height_scale)
-                    actual_height = orig_height * scale
-                    logo_height = actual_height
-            except Exception as e:
-                logger.warning(f"Fehler beim Berechnen der Logo-Höhe: {e}")
-                logo_height = 0
-        
-        # Y-Position für Metadaten - GLEICHE Logik wie in _draw_header
-        min_y_pos = top_start - 1.3*cm  # Mindestabstand zum Projektnamen
-        logo_bottom = top_start - logo_height if logo_height > 0 else top_start
-        y_pos = min(min_y_pos, logo_bottom - 0.3*cm)
-        
-        # Nach der zweiten Metadaten-Zeile (Systemgrenze)
-        y_pos -= 0.4*cm
-        
-        # Linie 0.5cm unter der letzten Metadaten-Zeile
-        line_y_pos = y_pos - 0.5*cm
-        
-        return line_y_pos
-    
-    def _calculate_top_margin(self) -> float:
+                kind = 'raster'
+
+            # Skalierungsfaktor unter Beibehaltung des Seitenverhältnisses
+            scale = min(LOGO_MAX_WIDTH / orig_width, LOGO_MAX_HEIGHT / orig_height)
+            actual_width = orig_width * scale
+            actual_height = orig_height * scale
+
+            if drawing is not None:
+                # SVG einmal skalieren statt auf jeder Seite
+                drawing.width = actual_width
+                drawing.height = actual_height
+                drawing.scale(scale, scale)
+
+            logo = _LogoInfo(kind, orig_width, orig_height, scale,
+                             actual_width, actual_height, drawing)
+            if cache_key is not None:
+                self._svg_logo_cache[cache_key] = logo
+            return logo
+        except Exception as e:
+            logger.warning(f"Fehler beim Laden des Logos: {e}")
+            return None
+
+    def _compute_header_layout(self) -> dict:
         """
-        Berechnet den benötigten Top-Margin basierend auf der Logo-Höhe
+        Berechnet Linienposition und Top-Margin des Headers in einem Durchgang
+        Verwendet die EXAKT GLEICHE Logik wie _draw_header
 
         Returns:
-            Top-Margin in Punkten
+            Dict mit 'date_y'/'sysbound_y' (Y-Positionen der Metadaten),
+            'line_y' (Y-Position der Trennlinie) und 'top_margin' (in Punkten)
         """
-        # Basis-Elemente
-        top_start = 1.5*cm  # Abstand vom oberen Rand
         min_header_height = 2.5*cm  # Minimale Header-Höhe (ohne Logo)
 
-        # Logo-Höhe berechnen
-        logo_height = 0
-        if self.config.logo_path and Path(self.config.logo_path).exists():
-            try:
-                logo_path = Path(self.config.logo_path)
-                
-                if logo_path.suffix.lower() == '.svg':
-                    # SVG
-                    from svglib.svglib import svg2rlg
-                    drawing = svg2rlg(str(logo_path))
-                    if drawing:
-                        orig_width = drawing.width
-                        orig_height = drawing.height
-                        
-                        # Berechne skalierte Höhe
-                        max_width = 4*cm
-                        max_height = 2.5*cm
-                        width_scale = max_width / orig_width
-                        height_scale = max_height / orig_height
-                        scale = min(width_scale, height_scale)
-                        logo_height = orig_height * scale
-                else:
-                    # Raster-Bild
-                    from PIL import Image
-                    img = Image.open(self.config.logo_path)
-                    orig_width, orig_height = img.size
-                    
-                    # Berechne skalierte Höhe
-                    max_width = 4*cm
-                    max_height = 2.5*cm
-                    width_scale = max_width / orig_width
-                    height_scale = max_height / orig_height
-                    scale = min(width_scale, height_scale)
-                    logo_height = orig_height * scale
-            except Exception as e:
-                logger.warning(f"Fehler beim Berechnen der Logo-Höhe: {e}")
-                logo_height = 0
+        # Logo-Höhe (falls vorhanden)
+        logo_height = self._logo.actual_height if self._logo else 0
+
+        # ===== LINIENPOSITION =====
+        # Y-Position für Metadaten - GLEICHE Logik wie in _draw_header
+        min_y_pos = HEADER_TOP_Y - META_MIN_OFFSET  # Mindestabstand zum Projektnamen
+        logo_bottom = HEADER_TOP_Y - logo_height if logo_height > 0 else HEADER_TOP_Y
+        date_y = min(min_y_pos, logo_bottom - META_LOGO_GAP)
 
-        # Header-Höhe berechnen
+        # Nach der zweiten Metadaten-Zeile (Systemgrenze)
+        sysbound_y = date_y - META_LINE_GAP
+
+        # Linie 0.5cm unter der letzten Metadaten-Zeile
+        line_y_pos = sysbound_y - HEADER_LINE_GAP
+
+        # ===== TOP-MARGIN =====
         # Projektname + Metadaten (2 Zeilen) + Abstände
-        metadata_height = 1.3*cm + 0.4*cm  # Datum + Systemgrenze
+        metadata_height = META_MIN_OFFSET + META_LINE_GAP  # Datum + Systemgrenze
 
         # Gesamthöhe = top_start + max(logo_height, min_content_height) + Linie + Abstand
         if logo_height > 0:
@@ -171,10 +240,15 @@ class PDFHeaderFooter:
         else:
             header_content = min_header_height
 
-        total_header = top_start + header_content + \
+        total_header = HEADER_TOP_OFFSET + header_content + \
             0.6*cm  # Reduzierter Abstand zwischen Linie und Content
 
-        return total_header
+        return {
+            'date_y': date_y,
+            'sysbound_y': sysbound_y,
+            'line_y': line_y_pos,
+            'top_margin': total_header
+        }
 
     def get_heading_position_from_top(self, fixed_distance_below_line: float = 0.5*cm) -> float:
         """
@@ -201,8 +275,16 @@ class PDFHeaderFooter:
         canvas.saveState()
 
         try:
-            self._draw_header(canvas, doc)
-            self._draw_footer(canvas, doc)
+            # Alles außer der Seitenzahl ist auf jeder Seite gleich: einmal als
+            # Form-XObject zeichnen und danach pro Seite nur referenzieren
+            if not self._static_form_ready:
+                canvas.beginForm(STATIC_FORM_NAME)
+                self._draw_header(canvas, doc)
+                self._draw_footer(canvas, doc)
+                canvas.endForm()
+                self._static_form_ready = True
+            canvas.doForm(STATIC_FORM_NAME)
+            self._draw_page_number(canvas)
         except Exception as e:
             logger.error(
                 f"Fehler beim Zeichnen von Header/Footer: {e}", exc_info=True)
@@ -211,187 +293,110 @@ class PDFHeaderFooter:
 
     def _draw_header(self, canvas, doc):
         """Zeichnet Header"""
-        # Startposition oben (für Logo und Projektname gleich)
-        top_start = self.page_height - 1.5*cm
+        # Startposition oben (für Logo und Projektname gleich): HEADER_TOP_Y
 
         # ===== LOGO =====
-        logo_height = 0
-        if self.config.logo_path and Path(self.config.logo_path).exists():
+        if self._logo:
+            logo = self._logo
             try:
-                logo_path = Path(self.config.logo_path)
-                
-                # Prüfe ob SVG
-                if logo_path.suffix.lower() == '.svg':
-                    # SVG mit svglib/reportlab
-                    from svglib.svglib import svg2rlg
-                    from reportlab.graphics import renderPDF
-                    
-                    # Lade SVG
-                    drawing = svg2rlg(str(logo_path))
-                    if drawing:
-                        # Originalgröße
-                        orig_width = drawing.width
-                        orig_height = drawing.height
-                        
-                        # Skalierung berechnen
-                        max_width = 4*cm
-                        max_height = 2.5*cm
-                        width_scale = max_width / orig_width
-                        height_scale = max_height / orig_height
-                        scale = min(width_scale, height_scale)
-                        
-                        # Skalieren
-                        actual_width = orig_width * scale
-                        actual_height = orig_height * scale
-                        logo_height = actual_height
-                        
-                        # Zeichne SVG
-                        drawing.width = actual_width
-                        drawing.height = actual_height
-                        drawing.scale(scale, scale)
-                        
-                        renderPDF.draw(
-                            drawing,
-                            canvas,
-                            self.left_margin,
-                            top_start - actual_height
-                        )
-                    else:
-                        logger.warning(f"SVG konnte nicht geladen werden: {logo_path}")
-                        logo_height = 0
+                if logo.kind == 'svg':
+                    # SVG mit svglib/reportlab (Drawing ist bereits skaliert)
+                    renderPDF.draw(
+                        logo.drawing,
+                        canvas,
+                        LEFT_MARGIN,
+                        HEADER_TOP_Y - logo.actual_height
+                    )
                 else:
                     # Raster-Bild (PNG, JPG, etc.)
-                    from PIL import Image
-                    
-                    # Lade das Bild, um die Originalabmessungen zu ermitteln
-                    img = Image.open(self.config.logo_path)
-                    orig_width, orig_height = img.size
-                    
-                    # Berechne die Zielabmessungen unter Beibehaltung des Seitenverhältnisses
-                    max_width = 4*cm
-                    max_height = 2.5*cm  # Maximal erlaubte Höhe
-                    
-                    # Berechne Skalierungsfaktor
-                    width_scale = max_width / orig_width
-                    height_scale = max_height / orig_height
-                    scale = min(width_scale, height_scale)
-                    
-                    # Tatsächliche Dimensionen
-                    actual_width = orig_width * scale
-                    actual_height = orig_height * scale
-                    logo_height = actual_height
-                    
+                    # Bewusst Pfad statt ImageReader: ReportLab legt das Bild beim
+                    # ersten Aufruf als XObject ab und erkennt es danach am Hash des
+                    # Dateinamens wieder. Ein ImageReader würde auf jeder Seite über
+                    # die kompletten RGB-Daten gehasht (gemessen ~1.7x langsamer).
                     # Zeichne das Logo - Ankerpunkt oben links
-                    # y-Position: von top_start nach unten
+                    # y-Position: von HEADER_TOP_Y nach unten
                     canvas.drawImage(
                         self.config.logo_path,
-                        self.left_margin,
-                        top_start - actual_height,  # Logo wächst nach unten
-                        width=actual_width,
-                        height=actual_height,
+                        LEFT_MARGIN,
+                        HEADER_TOP_Y - logo.actual_height,  # Logo wächst nach unten
+                        width=logo.actual_width,
+                        height=logo.actual_height,
                         preserveAspectRatio=True,
                         mask='auto'
                     )
             except Exception as e:
                 logger.warning(f"Logo konnte nicht gezeichnet werden: {e}")
                 logger.exception(e)
-                logo_height = 0
 
         # ===== PROJEKTNAME =====
         # Rechts oben, blau, fett - Ankerpunkt oben rechts
         canvas.setFont('Helvetica-Bold', 16)
         canvas.setFillColor(colors.black)
-        canvas.drawRightString(
-            self.page_width - self.right_margin,
-            top_start - 0.3*cm,  # Leicht nach unten versetzt für optische Ausrichtung
+        canvas.drawString(
+            self._project_name_x,
+            PROJECT_NAME_Y,
             self.project.name
         )
 
         # ===== METADATEN =====
-        # Datum und Systemgrenze rechts
-        # Position abhängig von Logo-Höhe oder mindestens 1.5cm unter Projektname
-        canvas.setFont('Helvetica', 9)
-        canvas.setFillColor(colors.grey)
+        # Datum und Systemgrenze rechts (Positionen aus __init__)
+        # Beide Zeilen in einem Textobjekt (ein BT/ET-Block im PDF)
+        meta = canvas.beginText(self._date_x, self._date_y)
+        meta.setFont('Helvetica', 9)
+        meta.setFillColor(colors.grey)
+        meta.textOut(self._date_str)
 
-        # Berechne Start-Position für Metadaten
-        # Entweder unter dem Logo oder mindestens 1.0cm unter dem Projektnamen
-        min_y_pos = top_start - 1.3*cm  # Mindestabstand zum Projektnamen
-        logo_bottom = top_start - logo_height if logo_height > 0 else top_start
-        y_pos = min(min_y_pos, logo_bottom - 0.3*cm)
-
-        canvas.drawRightString(
-            self.page_width - self.right_margin,
-            y_pos,
-            f"Datum: {datetime.now().strftime('%d.%m.%Y')}"
-        )
-
-        y_pos -= 0.4*cm
-        canvas.drawRightString(
-            self.page_width - self.right_margin,
-            y_pos,
-            f"Systemgrenze: {self.project.system_boundary}"
-        )
+        meta.setTextOrigin(self._sysbound_x, self._sysbound_y)
+        meta.textOut(self._sysbound_str)
+        canvas.drawText(meta)
 
         # ===== TRENNLINIE =====
-        # Positioniere die Linie unter den Metadaten mit ausreichend Abstand
-        line_y_pos = y_pos - 0.5*cm  # 0.5cm Abstand unter der letzten Metadaten-Zeile
-        
-        # Speichere Position für spätere Verwendung
-        self.header_line_y = line_y_pos
-
+        # 0.5cm unter der letzten Metadaten-Zeile (Position aus __init__)
         canvas.setStrokeColor(colors.black)
         canvas.setLineWidth(1)
         canvas.line(
-            self.left_margin,
-            line_y_pos,
-            self.page_width - self.right_margin,
-            line_y_pos
+            LEFT_MARGIN,
+            self.header_line_y,
+            RIGHT_X,
+            self.header_line_y
         )
 
     def _draw_footer(self, canvas, doc):
-        """Zeichnet Footer"""
+        """Zeichnet Footer (ohne Seitenzahl, siehe _draw_page_number)"""
         # ===== TRENNLINIE =====
         canvas.setStrokeColor(colors.grey)
         canvas.setLineWidth(0.5)
         canvas.line(
-            self.left_margin,
-            2.3*cm,
-            self.page_width - self.right_margin,
-            2.3*cm
+            LEFT_MARGIN,
+            FOOTER_LINE_Y,
+            RIGHT_X,
+            FOOTER_LINE_Y
         )
 
+        # ===== DISCLAIMER =====
+        # Links, klein, mehrzeilig
+        if self._disclaimer_lines:
+            # Zeilen (umgebrochen in __init__) untereinander in einem Textobjekt
+            disclaimer = canvas.beginText(LEFT_MARGIN, DISCLAIMER_Y)
+            disclaimer.setFont('Helvetica', 7, leading=DISCLAIMER_LEADING)
+            disclaimer.setFillColor(colors.grey)
+            for line in self._disclaimer_lines:
+                disclaimer.textLine(line)
+            canvas.drawText(disclaimer)
+
+    def _draw_page_number(self, canvas):
+        """Zeichnet die Seitenzahl (einziger seitenabhängiger Teil des Footers)"""
         # ===== SEITENZAHL =====
         # Rechts
         canvas.setFont('Helvetica', 9)
         canvas.setFillColor(colors.black)
         page_num = canvas.getPageNumber()
         canvas.drawRightString(
-            self.page_width - self.right_margin,
-            1.8*cm,
+            RIGHT_X,
+            PAGE_NUMBER_Y,
             f"Seite {page_num}"
         )
 
-        # ===== DISCLAIMER =====
-        # Links, klein, mehrzeilig
-        if self.config.disclaimer:
-            canvas.setFont('Helvetica', 7)
-            canvas.setFillColor(colors.grey)
-
-            # Text umbrechen (max. 12 cm breit)
-            max_width = 12*cm
-            lines = self._wrap_text(
-                self.config.disclaimer,
-                'Helvetica',
-                7,
-                max_width
-            )
-
-            # Zeichne Zeilen von unten nach oben
-            y_start = 1.8*cm
-            for line in lines:
-                canvas.drawString(self.left_margin, y_start, line)
-                y_start -= 0.3*cm
-
     def _wrap_text(self, text: str, font_name: str, font_size: int, max_width: float) -> list:
         """
         Umbrechen von Text in mehrere Zeilen
@@ -408,15 +413,21 @@ class PDFHeaderFooter:
         words = text.split()
         lines = []
         current_line = []
+        current_width = 0
 
+        # Jedes Wort nur einmal messen; Zeilenbreite = Summe der Wortbreiten + Leerzeichen
+        space_width = _word_width(' ', font_name, font_size)
         for word in words:
-            test_line = ' '.join(current_line + [word])
-            if stringWidth(test_line, font_name, font_size) <= max_width:
+            word_width = _word_width(word, font_name, font_size)
+            added = space_width + word_width if current_line else word_width
+            if current_width + added <= max_width:
                 current_line.append(word)
+                current_width += added
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
                 current_line = [word]
+                current_width = word_width
 
         if current_line:
             lines.append(' '.join(current_line))
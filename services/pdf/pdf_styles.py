@@ -5,6 +5,8 @@ Definiert alle Text-Styles für das PDF (Überschriften, Fließtext, Tabellen, e
 im Stil des Excel-Tools mit gelben Section-Headings und professioneller Formatierung.
 """
 
+from functools import lru_cache
+
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
@@ -23,6 +25,16 @@ class PDFStyles:
         # Custom Styles hinzufügen
         self._create_custom_styles()
 
+        # Häufig genutzte Styles direkt als Attribute (kein get() pro Zugriff)
+        self.project_title = self.base_styles['ProjectTitle']
+        self.section_heading = self.base_styles['SectionHeading']  # Gelber Balken
+        self.sub_heading = self.base_styles['SubHeading']
+        self.body_text = self.base_styles['BodyText']
+        self.comment = self.base_styles['Comment']
+        self.metadata = self.base_styles['Metadata']
+        self.disclaimer = self.base_styles['Disclaimer']
+        self.bullet_list = self.base_styles['BulletList']
+
     def _create_custom_styles(self):
         """Erstellt alle Custom-Styles"""
 
@@ -68,7 +80,7 @@ class PDFStyles:
             name='SubHeading',
             parent=self.base_styles['Heading3'],
             fontSize=12,
-            textColor=colors.HexColor('#1f6aa5'),
+            textColor=PDFColors.PRIMARY_BLUE,
             fontName='Helvetica-Bold',
             spaceBefore=8,
             spaceAfter=4,
@@ -95,15 +107,15 @@ class PDFStyles:
             parent=self.base_styles['Normal'],
             fontSize=9,
             fontName='Helvetica-Oblique',
-            textColor=colors.HexColor('#666666'),
+            textColor=PDFColors.TEXT_DARK_GRAY,
             spaceBefore=6,
             spaceAfter=6,
             leftIndent=10,
             rightIndent=10,
             borderWidth=0.5,
-            borderColor=colors.HexColor('#CCCCCC'),
+            borderColor=PDFColors.BORDER_GRAY,
             borderPadding=8,
-            backColor=colors.HexColor('#F5F5F5'),  # Hellgrau
+            backColor=PDFColors.BG_LIGHT_GRAY,  # Hellgrau
             leading=12
         ))
 
@@ -156,46 +168,6 @@ class PDFStyles:
         """
         return self.base_styles[style_name]
 
-    @property
-    def project_title(self) -> ParagraphStyle:
-        """Projekt-Titel Style"""
-        return self.get('ProjectTitle')
-
-    @property
-    def section_heading(self) -> ParagraphStyle:
-        """Sektions-Überschrift Style (gelber Balken)"""
-        return self.get('SectionHeading')
-
-    @property
-    def sub_heading(self) -> ParagraphStyle:
-        """Unter-Überschrift Style"""
-        return self.get('SubHeading')
-
-    @property
-    def body_text(self) -> ParagraphStyle:
-        """Fließtext Style"""
-        return self.get('BodyText')
-
-    @property
-    def comment(self) -> ParagraphStyle:
-        """Kommentar Style"""
-        return self.get('Comment')
-
-    @property
-    def metadata(self) -> ParagraphStyle:
-        """Metadaten Style"""
-        return self.get('Metadata')
-
-    @property
-    def disclaimer(self) -> ParagraphStyle:
-        """Disclaimer Style"""
-        return self.get('Disclaimer')
-
-    @property
-    def bullet_list(self) -> ParagraphStyle:
-        """Aufzählungs-Liste Style"""
-        return self.get('BulletList')
-
 
 # ===== FARB-DEFINITIONEN =====
 # Zentrale Farb-Palette für konsistentes Design
@@ -231,9 +203,11 @@ class PDFColors:
     TABLE_GRID = colors.black
 
 
+@lru_cache(maxsize=1)
 def get_styles() -> PDFStyles:
     """
-    Factory-Funktion: Erstellt und gibt PDFStyles-Instanz zurück
+    Factory-Funktion: Gibt die gemeinsame PDFStyles-Instanz zurück
+    (wird einmal erstellt; die Styles werden beim Export nur gelesen)
 
     Returns:
         PDFStyles-Instanz mit allen Styles
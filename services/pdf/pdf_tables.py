@@ -10,7 +10,9 @@ Alle Tabellen mit korrekter Formatierung gemäß Excel-Vorgabe.
 """
 
 import logging
-from typing import Optional, List
+import math
+from operator import attrgetter
+from typing import Callable, Optional, List, Tuple
 
 from reportlab.platypus import Table, TableStyle
 from reportlab.lib import colors
@@ -22,6 +24,82 @@ from services.pdf.pdf_styles import PDFColors
 
 logger = logging.getLogger(__name__)
 
+# Kopfzeilen der Tabellen (pro Tabelle nur kopiert)
+_DASHBOARD_HEADER = ('Variante', 'CO2-Gesamt [t]')
+_VARIANT_HEADER = ('Pos', 'Material', 'Menge', 'Einheit', 'CO2 [t]')
+
+# Tabellen-Styles einmalig auf Modulebene (TableStyle wird von setStyle nur gelesen)
+_DASHBOARD_TABLE_STYLE = TableStyle([
+    # ===== HEADER =====
+    ('BACKGROUND', (0, 0), (-1, 0), PDFColors.TABLE_HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), PDFColors.TABLE_HEADER_TEXT),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 0), (-1, 0), 8),
+
+    # ===== DATEN =====
+    ('ALIGN', (0, 1), (0, -1), 'LEFT'),      # Varianten-Namen links
+    ('ALIGN', (1, 1), (1, -1), 'RIGHT'),     # CO₂-Werte rechts
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('LEFTPADDING', (0, 1), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 1), (-1, -1), 8),
+
+    # Alternierende Zeilen
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PDFColors.TABLE_ROW_ALT_BG]),
+
+    # ===== GRID =====
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.TABLE_GRID),
+    ('BOX', (0, 0), (-1, -1), 1.5, PDFColors.BORDER_BLACK),
+])
+
+_VARIANT_TABLE_STYLE = TableStyle([
+    # ===== HEADER =====
+    ('BACKGROUND', (0, 0), (-1, 0), PDFColors.TABLE_HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), PDFColors.TABLE_HEADER_TEXT),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+
+    # ===== DATEN =====
+    ('ALIGN', (0, 1), (0, -2), 'CENTER'),    # Pos zentriert
+    ('ALIGN', (1, 1), (1, -2), 'LEFT'),      # Material links
+    ('ALIGN', (2, 1), (2, -2), 'RIGHT'),     # Menge rechts
+    ('ALIGN', (3, 1), (3, -2), 'CENTER'),    # Einheit zentriert
+    ('ALIGN', (4, 1), (4, -2), 'RIGHT'),     # CO₂ rechts
+    ('FONTNAME', (0, 1), (-1, -2), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -2), 9),
+    ('TOPPADDING', (0, 1), (-1, -2), 4),
+    ('BOTTOMPADDING', (0, 1), (-1, -2), 4),
+    ('LEFTPADDING', (0, 1), (-1, -2), 6),
+    ('RIGHTPADDING', (0, 1), (-1, -2), 6),
+
+    # Alternierende Zeilen
+    ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, PDFColors.TABLE_ROW_ALT_BG]),
+
+    # ===== SUMMEN-ZEILE =====
+    ('BACKGROUND', (0, -1), (-1, -1), PDFColors.TABLE_SUM_BG),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, -1), (-1, -1), 10),
+    ('ALIGN', (1, -1), (1, -1), 'RIGHT'),    # "SUMME" rechts
+    ('ALIGN', (4, -1), (4, -1), 'RIGHT'),    # CO₂-Wert rechts
+    ('TOPPADDING', (0, -1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, -1), (-1, -1), 8),
+    ('LEFTPADDING', (0, -1), (-1, -1), 6),
+    ('RIGHTPADDING', (0, -1), (-1, -1), 6),
+
+    # ===== GRID =====
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.TABLE_GRID),
+    ('BOX', (0, 0), (-1, -1), 1.5, PDFColors.BORDER_BLACK),
+    ('LINEBELOW', (0, -2), (-1, -2), 2, PDFColors.BORDER_BLACK),  # Linie vor SUMME
+])
+
 
 class PDFTableCreator:
     """Erstellt Tabellen für PDF-Export"""
@@ -35,6 +113,12 @@ class PDFTableCreator:
         """
         self.project = project
         self.colors = PDFColors()
+
+        # Systemgrenze ist pro Export fest: Feldauswahl nur einmal auflösen
+        fields, default = self._resolve_boundary_fields(project.system_boundary)
+        self._row_value = self._build_boundary_getter('result_', fields, default)
+        # Summen ohne Default: None = Summe fehlt (siehe _get_variant_total)
+        self._variant_sum = self._build_boundary_getter('sum_', fields, None)
     
     def create_dashboard_table(self, variant_indices: List[int]) -> Optional[Table]:
         """
@@ -47,58 +131,29 @@ class PDFTableCreator:
             ReportLab Table oder None bei Fehler
         """
         try:
-            variants = [
-                self.project.variants[i]
+            variants = self.project.variants
+            num_variants = len(variants)
+            get_total = self._get_variant_total
+            
+            # Daten direkt in einem Durchgang (ohne Zwischenliste der Varianten)
+            rows = [
+                [variants[i].name, f"{get_total(variants[i]) / 1000.0:.2f}"]
                 for i in variant_indices
-                if i < len(self.project.variants)
+                if i < num_variants
             ]
             
-            if not variants:
+            if not rows:
                 logger.warning("Keine Varianten für Dashboard-Tabelle")
                 return None
             
-            # Header
-            data = [['Variante', 'CO2-Gesamt [t]']]
-            
-            # Daten
-            for variant in variants:
-                value = self._get_variant_total(variant)
-                data.append([
-                    variant.name,
-                    f"{value / 1000.0:.2f}"
-                ])
+            # Header + Daten
+            data = [list(_DASHBOARD_HEADER), *rows]
             
             # Tabelle erstellen
             table = Table(data, colWidths=[12*cm, 4*cm])
             
             # Style
-            table.setStyle(TableStyle([
-                # ===== HEADER =====
-                ('BACKGROUND', (0, 0), (-1, 0), self.colors.TABLE_HEADER_BG),
-                ('TEXTCOLOR', (0, 0), (-1, 0), self.colors.TABLE_HEADER_TEXT),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                ('TOPPADDING', (0, 0), (-1, 0), 8),
-                
-                # ===== DATEN =====
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),      # Varianten-Namen links
-                ('ALIGN', (1, 1), (1, -1), 'RIGHT'),     # CO₂-Werte rechts
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                ('LEFTPADDING', (0, 1), (-1, -1), 8),
-                ('RIGHTPADDING', (0, 1), (-1, -1), 8),
-                
-                # Alternierende Zeilen
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, self.colors.TABLE_ROW_ALT_BG]),
-                
-                # ===== GRID =====
-                ('GRID', (0, 0), (-1, -1), 1, self.colors.TABLE_GRID),
-                ('BOX', (0, 0), (-1, -1), 1.5, self.colors.BORDER_BLACK),
-            ]))
+            table.setStyle(_DASHBOARD_TABLE_STYLE)
             
             return table
             
@@ -122,13 +177,16 @@ class PDFTableCreator:
                 return None
             
             # Header
-            data = [['Pos', 'Material', 'Menge', 'Einheit', 'CO2 [t]']]
+            data = [list(_VARIANT_HEADER)]
             
             MAX_NAME_LENGTH = 50  # Maximale Länge für Material-Namen in Tabelle
             
-            # Daten
+            # Daten (Zugriffsfunktion lokal, spart den Methodenaufruf pro Zeile)
+            get_value = self._row_value
+            values = []
             for i, row in enumerate(variant.rows, 1):
-                value = self._get_value_for_boundary(row)
+                value = get_value(row)
+                values.append(value)
                 # Kürze zu lange Namen mit ...
                 name = row.material_name
                 if len(name) > MAX_NAME_LENGTH:
@@ -142,56 +200,18 @@ class PDFTableCreator:
                     f"{value / 1000.0:.2f}"
                 ])
             
-            # SUMMEN-Zeile
-            total = self._get_variant_total(variant)
+            # SUMMEN-Zeile: vorberechnete Summe, sonst Summe der gedruckten Zeilenwerte
+            # (gleiche Regel wie _get_variant_total, ohne die Zeilen erneut zu lesen)
+            total = self._variant_sum(variant)
+            if total is None:
+                total = math.fsum(values)
             data.append(['', 'SUMME', '', '', f"{total / 1000.0:.2f}"])
             
             # Tabelle erstellen
             table = Table(data, colWidths=[1.5*cm, 8*cm, 2.5*cm, 2*cm, 2*cm])
             
             # Style
-            table.setStyle(TableStyle([
-                # ===== HEADER =====
-                ('BACKGROUND', (0, 0), (-1, 0), self.colors.TABLE_HEADER_BG),
-                ('TEXTCOLOR', (0, 0), (-1, 0), self.colors.TABLE_HEADER_TEXT),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('TOPPADDING', (0, 0), (-1, 0), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-                
-                # ===== DATEN =====
-                ('ALIGN', (0, 1), (0, -2), 'CENTER'),    # Pos zentriert
-                ('ALIGN', (1, 1), (1, -2), 'LEFT'),      # Material links
-                ('ALIGN', (2, 1), (2, -2), 'RIGHT'),     # Menge rechts
-                ('ALIGN', (3, 1), (3, -2), 'CENTER'),    # Einheit zentriert
-                ('ALIGN', (4, 1), (4, -2), 'RIGHT'),     # CO₂ rechts
-                ('FONTNAME', (0, 1), (-1, -2), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -2), 9),
-                ('TOPPADDING', (0, 1), (-1, -2), 4),
-                ('BOTTOMPADDING', (0, 1), (-1, -2), 4),
-                ('LEFTPADDING', (0, 1), (-1, -2), 6),
-                ('RIGHTPADDING', (0, 1), (-1, -2), 6),
-                
-                # Alternierende Zeilen
-                ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, self.colors.TABLE_ROW_ALT_BG]),
-                
-                # ===== SUMMEN-ZEILE =====
-                ('BACKGROUND', (0, -1), (-1, -1), self.colors.TABLE_SUM_BG),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, -1), (-1, -1), 10),
-                ('ALIGN', (1, -1), (1, -1), 'RIGHT'),    # "SUMME" rechts
-                ('ALIGN', (4, -1), (4, -1), 'RIGHT'),    # CO₂-Wert rechts
-                ('TOPPADDING', (0, -1), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, -1), (-1, -1), 8),
-                ('LEFTPADDING', (0, -1), (-1, -1), 6),
-                ('RIGHTPADDING', (0, -1), (-1, -1), 6),
-                
-                # ===== GRID =====
-                ('GRID', (0, 0), (-1, -1), 1, self.colors.TABLE_GRID),
-                ('BOX', (0, 0), (-1, -1), 1.5, self.colors.BORDER_BLACK),
-                ('LINEBELOW', (0, -2), (-1, -2), 2, self.colors.BORDER_BLACK),  # Linie vor SUMME
-            ]))
+            table.setStyle(_VARIANT_TABLE_STYLE)
             
             return table
             
@@ -199,36 +219,81 @@ class PDFTableCreator:
             logger.error(f"Fehler beim Erstellen der Varianten-Tabelle: {e}", exc_info=True)
             return None
     
-    def _get_value_for_boundary(self, row) -> float:
+    @staticmethod
+    def _resolve_boundary_fields(boundary: str) -> Tuple[Tuple[str, ...], Optional[float]]:
         """
-        Holt korrekten CO₂-Wert basierend auf Systemgrenze
-        
+        Bestimmt die Ergebnisfelder für eine Systemgrenze
+
         Args:
-            row: MaterialRow
-            
+            boundary: Systemgrenze des Projekts
+
         Returns:
-            CO₂-Wert in kg
+            Tuple (Feld-Suffixe in Fallback-Reihenfolge, Default-Wert oder None)
         """
-        boundary = self.project.system_boundary
-        
         if 'bio' in boundary.lower():
             if 'D' in boundary:
-                return row.result_acd_bio or row.result_acd or 0.0
+                return ('acd_bio', 'acd'), 0.0
             elif 'C3' in boundary or 'C4' in boundary:
-                return row.result_ac_bio or row.result_ac
+                return ('ac_bio', 'ac'), None
             else:
-                return row.result_a_bio or row.result_a
+                return ('a_bio', 'a'), None
         else:
             if 'D' in boundary:
-                return row.result_acd or 0.0
+                return ('acd',), 0.0
             elif 'C3' in boundary or 'C4' in boundary:
-                return row.result_ac
+                return ('ac',), None
             else:
-                return row.result_a
+                return ('a',), None
+
+    @staticmethod
+    def _build_boundary_getter(prefix: str, fields: Tuple[str, ...],
+                               default: Optional[float]) -> Callable:
+        """
+        Erstellt die Zugriffsfunktion für die Felder einer Systemgrenze
+        (Werte werden mit 'or' verkettet, wie bisher)
+
+        Args:
+            prefix: Attribut-Präfix ('result_' für Zeilen, 'sum_' für Varianten)
+            fields: Feld-Suffixe aus _resolve_boundary_fields
+            default: Wert, falls alle Felder leer sind (None = letztes Feld)
+
+        Returns:
+            Funktion Objekt -> CO₂-Wert in kg
+        """
+        getters = [attrgetter(prefix + field) for field in fields]
+
+        if len(getters) == 1:
+            get = getters[0]
+            if default is None:
+                return get
+            return lambda obj: get(obj) or default
+
+        primary, fallback = getters
+        if default is None:
+            return lambda obj: primary(obj) or fallback(obj)
+        return lambda obj: primary(obj) or fallback(obj) or default
+
+    def _get_value_for_boundary(self, row) -> float:
+        """
+        Holt korrekten CO₂-Wert basierend auf Systemgrenze
+        
+        Args:
+            row: MaterialRow
+            
+        Returns:
+            CO₂-Wert in kg
+        """
+        return self._row_value(row)
     
     def _get_variant_total(self, variant: Variant) -> float:
         """
         Holt Variantensumme basierend auf Systemgrenze
+
+        Vorberechnete Summe (variant.sum_*), falls vorhanden. Fehlt sie (sum_acd ist
+        None, wenn nicht alle Zeilen D-Werte haben), werden die gedruckten
+        Zeilenwerte (_row_value) summiert, damit SUMME zu den Zeilen passt:
+        Zeilen ohne D-Wert zählen mit 0. Der Excel-Export schreibt in diesem
+        Fall dagegen 0.0 als Summe.
         
         Args:
             variant: Variante
@@ -236,19 +301,7 @@ class PDFTableCreator:
         Returns:
             CO₂-Summe in kg
         """
-        boundary = self.project.system_boundary
-        
-        if 'bio' in boundary.lower():
-            if 'D' in boundary:
-                return variant.sum_acd_bio or variant.sum_acd or 0.0
-            elif 'C3' in boundary or 'C4' in boundary:
-                return variant.sum_ac_bio or variant.sum_ac
-            else:
-                return variant.sum_a_bio or variant.sum_a
-        else:
-            if 'D' in boundary:
-                return variant.sum_acd or 0.0
-            elif 'C3' in boundary or 'C4' in boundary:
-                return variant.sum_ac
-            else:
-                return variant.sum_a
+        total = self._variant_sum(variant)
+        if total is None:
+            return math.fsum(map(self._row_value, variant.rows))
+        return total
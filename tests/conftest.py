@@ -0,0 +1,13 @@
+"""
+Gemeinsame Test-Konfiguration
+
+Macht die Pakete im Projektverzeichnis (models, services, ...) importierbar,
+unabhängig davon, von wo pytest gestartet wird.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
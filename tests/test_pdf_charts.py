@@ -0,0 +1,119 @@
+"""
+Tests für die Übergabe gerasterter Diagramme an ReportLab (services/pdf/pdf_charts.py)
+"""
+
+import io
+
+from PIL import Image
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import SimpleDocTemplate
+
+from services.pdf.pdf_charts import PDFChartCreator, PNG_PALETTE_MAX_COLORS, ReaderImage
+
+
+def _striped_image(num_colors: int) -> Image.Image:
+    """RGB-Bild mit genau num_colors Farben (je eine Spalte pro Farbe)"""
+    img = Image.new('RGB', (num_colors, 4))
+    pixels = img.load()
+    for x in range(num_colors):
+        color = (x % 256, x // 256, (x * 37) % 256)
+        for y in range(4):
+            pixels[x, y] = color
+    return img
+
+
+def _embedded_rgb(img: Image.Image) -> bytes:
+    """RGB-Daten, die ReportLab für das Diagramm ins PDF schreiben würde"""
+    flowable = PDFChartCreator._to_rl_image(img, 4, 1, 'PNG')
+    return bytes(flowable.reader.getRGBData())
+
+
+def test_palette_path_is_lossless():
+    img = _striped_image(PNG_PALETTE_MAX_COLORS)
+    assert _embedded_rgb(img) == img.tobytes()
+
+
+def test_many_colors_stay_rgb():
+    img = _striped_image(PNG_PALETTE_MAX_COLORS + 1)
+    assert _embedded_rgb(img) == img.tobytes()
+
+
+def test_chart_export_leaves_global_rcparams_untouched():
+    import matplotlib
+
+    from models.project import Project
+    from models.variant import MaterialRow, Variant
+    from services.pdf.pdf_charts import _PDF_RC_CONTEXT
+
+    variant = Variant(name="Variante 1", rows=[
+        MaterialRow(material_id="m1", material_name="Beton", result_a=1000.0),
+        MaterialRow(material_id="m2", material_name="Holz", result_a=-400.0),
+    ])
+    variant.calculate_sums()
+    project = Project(variants=[variant])
+    before = {key: matplotlib.rcParams[key] for key in _PDF_RC_CONTEXT}
+
+    creator = PDFChartCreator(project)
+    assert creator.create_variant_chart(variant) is not None
+    assert creator.create_dashboard_chart([0]) is not None
+
+    assert {key: matplotlib.rcParams[key] for key in _PDF_RC_CONTEXT} == before
+
+
+def test_reader_image_embeds_shared_reader_once():
+    reader = ImageReader(_striped_image(16))
+    flowables = [ReaderImage(reader, width=100, height=25) for _ in range(2)]
+    assert flowables[0].wrap(500, 500) == (100, 25)
+
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer).build(flowables)
+
+    assert buffer.getvalue().count(b"/Subtype /Image") == 1
+
+
+def test_reader_image_defaults_to_image_size():
+    flowable = ReaderImage(ImageReader(_striped_image(16)))
+
+    assert flowable.wrap(500, 500) == (16, 4)
+
+
+def test_figure_to_image_uses_configured_dpi():
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    from models.project import Project
+
+    figure = Figure(figsize=(4, 3))
+    FigureCanvasAgg(figure)
+    figure.add_subplot().bar([0, 1], [1, 2])
+    creator = PDFChartCreator(Project(), dpi=100)
+
+    assert creator.figure_to_image(figure).reader.getSize() == (400, 300)
+
+    creator.dpi = 50
+    assert creator.figure_to_image(figure).reader.getSize() == (200, 150)
+
+
+def test_dashboard_ylabel_fits_left_margin(monkeypatch):
+    from models.project import Project
+    from models.variant import MaterialRow, Variant
+
+    rows = [MaterialRow(material_id="m1", material_name="Beton", result_a=1.2e6,
+                        result_ac=1.5e6, result_acd=1.4e6)]
+    variant = Variant(name="Variante 1", rows=rows)
+    variant.calculate_sums()
+    project = Project(variants=[variant], system_boundary="A1-A3 + C3 + C4 + D")
+
+    figures = []
+    monkeypatch.setattr(PDFChartCreator, '_to_flowable',
+                        lambda self, fig, w, h: figures.append(fig) or fig)
+    PDFChartCreator(project).create_dashboard_chart([0])
+
+    fig = figures[0]
+    # Wie beim Export: erst zeichnen, dann liegen die Label-Positionen fest
+    fig.canvas.draw()
+    renderer = fig.canvas.get_renderer()
+    ax = fig.axes[0]
+    # ylabel und Y-Tick-Labels liegen vollständig innerhalb der Figure
+    assert ax.yaxis.label.get_window_extent(renderer).x0 >= 0
+    assert ax.yaxis.get_tightbbox(renderer).x0 >= 0
@@ -0,0 +1,70 @@
+"""
+Tests für die Export-Konfiguration (services/pdf/pdf_config.py)
+"""
+
+import pytest
+
+from services.pdf.pdf_config import (
+    ExportConfig, InfoBlock, PREDEFINED_INFO_BLOCKS, get_predefined_info_block
+)
+
+
+def _block(block_id: str, text: str = "Text") -> InfoBlock:
+    return InfoBlock(id=block_id, title=block_id.title(), text=text)
+
+
+def test_info_blocks_can_be_passed_to_constructor():
+    blocks = [_block("methodik"), _block("ergebnisse")]
+
+    config = ExportConfig(info_blocks=blocks)
+
+    assert config.info_blocks == blocks
+    assert config.get_info_block("ergebnisse") is blocks[1]
+
+
+def test_info_blocks_can_be_assigned():
+    config = ExportConfig()
+    config.add_info_block(_block("methodik"))
+
+    config.info_blocks = [_block("projektbeschreibung")]
+
+    assert [ib.id for ib in config.info_blocks] == ["projektbeschreibung"]
+    assert config.get_info_block("methodik") is None
+
+
+def test_add_info_block_replaces_block_in_place():
+    config = ExportConfig(info_blocks=[_block("methodik"), _block("ergebnisse")])
+    replacement = _block("methodik", text="Neu")
+
+    config.add_info_block(replacement)
+
+    assert [ib.id for ib in config.info_blocks] == ["methodik", "ergebnisse"]
+    assert config.info_blocks[0] is replacement
+
+
+def test_remove_info_block():
+    config = ExportConfig(info_blocks=[_block("methodik"), _block("ergebnisse")])
+
+    config.remove_info_block("methodik")
+
+    assert [ib.id for ib in config.info_blocks] == ["ergebnisse"]
+
+
+def test_predefined_info_blocks_cannot_be_corrupted():
+    original_text = PREDEFINED_INFO_BLOCKS["methodik"].text
+
+    PREDEFINED_INFO_BLOCKS["methodik"].text = "Geändert"
+    for info_block in PREDEFINED_INFO_BLOCKS.values():
+        info_block.include = True
+    get_predefined_info_block("methodik").title = "Geändert"
+
+    assert PREDEFINED_INFO_BLOCKS["methodik"].text == original_text
+    assert PREDEFINED_INFO_BLOCKS["methodik"].title == "Methodik"
+    assert not any(ib.include for ib in PREDEFINED_INFO_BLOCKS.values())
+
+
+def test_predefined_info_blocks_are_read_only():
+    with pytest.raises(TypeError):
+        PREDEFINED_INFO_BLOCKS["methodik"] = InfoBlock(id="methodik", title="X", text="X")
+
+    assert get_predefined_info_block("unbekannt") is None
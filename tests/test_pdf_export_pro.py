@@ -0,0 +1,52 @@
+"""
+Tests für die Bildeinbettung im PDF-Export (services/pdf/pdf_export_pro.py)
+"""
+
+import io
+
+from PIL import Image
+
+from models.project import Project
+from services.pdf import ExportConfig, InfoBlock, PDFExporterPro
+
+
+def _write_jpeg(path, size=(640, 480), color=(200, 80, 40)) -> None:
+    Image.new('RGB', size, color).save(path, format='JPEG', quality=95)
+
+
+def _config(image_path: str, additional_image_path: str) -> ExportConfig:
+    config = ExportConfig(additional_image_path=additional_image_path)
+    config.add_info_block(InfoBlock(id="methodik", title="Methodik", text="Text",
+                                    image_path=image_path))
+    return config
+
+
+def _export(exporter: PDFExporterPro, config: ExportConfig) -> bytes:
+    buffer = io.BytesIO()
+    assert exporter.export(Project(), config, buffer)
+    return buffer.getvalue()
+
+
+def test_image_file_is_embedded_once_and_unchanged(tmp_path):
+    image_path = tmp_path / "bild.jpg"
+    _write_jpeg(image_path)
+
+    # Gleiche Datei als Info-Block-Bild und als Zusatzbild (unterschiedliche Größen)
+    pdf = _export(PDFExporterPro(), _config(str(image_path), str(image_path)))
+
+    assert pdf.count(b"/Subtype /Image") == 1
+    # JPEG wird in Originalgröße durchgereicht (kein Verkleinern/Neukodieren)
+    assert b"/DCTDecode" in pdf
+    assert b"/Height 480" in pdf and b"/Width 640" in pdf
+
+
+def test_reader_cache_only_keeps_images_of_current_config(tmp_path):
+    first, second = tmp_path / "a.jpg", tmp_path / "b.jpg"
+    _write_jpeg(first)
+    _write_jpeg(second, color=(10, 120, 200))
+    exporter = PDFExporterPro()
+
+    _export(exporter, _config(str(first), str(first)))
+    _export(exporter, _config(str(second), None))
+
+    assert [key[0] for key in exporter._image_reader_cache] == [str(second)]
@@ -0,0 +1,68 @@
+"""
+Tests für die Variantensummen der PDF-Tabellen (services/pdf/pdf_tables.py)
+"""
+
+import pytest
+
+from models.project import Project
+from models.variant import MaterialRow, Variant
+from services.pdf.pdf_tables import PDFTableCreator
+
+
+def _project(boundary: str, d_values) -> Project:
+    """Projekt mit einer Variante; je Zeile A1-A3+C3+C4 = 200 kg, D-Wert aus d_values"""
+    rows = [
+        MaterialRow(material_id=f"m{i}", material_name=f"Material {i}",
+                    result_a=100.0, result_ac=200.0, result_acd=d_value)
+        for i, d_value in enumerate(d_values)
+    ]
+    variant = Variant(name="Variante 1", rows=rows)
+    variant.calculate_sums()
+    return Project(variants=[variant], system_boundary=boundary)
+
+
+@pytest.mark.parametrize("boundary", ["A1-A3 + C3 + C4 + D", "A1-A3 + C3 + C4 + D (bio)"])
+def test_total_without_d_on_one_row_sums_printed_row_values(boundary):
+    project = _project(boundary, [150.0, None])
+    variant = project.variants[0]
+    assert variant.sum_acd is None
+
+    total = PDFTableCreator(project)._get_variant_total(variant)
+
+    # Zeile mit D: 150, Zeile ohne D wird in der Tabelle mit 0 gedruckt
+    assert total == pytest.approx(150.0)
+
+
+@pytest.mark.parametrize("boundary", ["A1-A3 + C3 + C4 + D", "A1-A3 + C3 + C4 + D (bio)"])
+def test_variant_table_sum_row_matches_printed_rows(boundary):
+    project = _project(boundary, [150.0, None])
+    variant = project.variants[0]
+
+    table = PDFTableCreator(project).create_variant_table(variant)
+
+    # Kopfzeile, Materialzeilen, SUMME-Zeile; Spalte 4 = CO2 [t]
+    cells = table._cellvalues
+    printed_rows = [float(row[4]) for row in cells[1:-1]]
+    assert cells[-1][1] == 'SUMME'
+    assert printed_rows == [0.15, 0.0]
+    assert float(cells[-1][4]) == pytest.approx(sum(printed_rows))
+
+
+def test_total_uses_precomputed_sum_when_all_rows_have_d():
+    project = _project("A1-A3 + C3 + C4 + D", [150.0, 120.0])
+    variant = project.variants[0]
+
+    assert PDFTableCreator(project)._get_variant_total(variant) == variant.sum_acd
+
+
+
+def test_mixed_variant_dashboard_total_matches_variant_sum_row():
+    project = _project("A1-A3 + C3 + C4 + D", [150.0, None, -50.0])
+    creator = PDFTableCreator(project)
+
+    dashboard = creator.create_dashboard_table([0])._cellvalues
+    variant_table = creator.create_variant_table(project.variants[0])._cellvalues
+
+    # Fehlende Summe: gedruckte Zeilen 0.15 + 0.00 - 0.05 (nicht 0.00 wie im Excel-Export)
+    assert dashboard[1] == ['Variante 1', '0.10']
+    assert variant_table[-1][4] == '0.10'
@@ -4,18 +4,25 @@ Dashboard-View - Vergleichsansicht (Tab 1)
 
 import customtkinter as ctk
 from tkinter import messagebox
+from collections import defaultdict
 from typing import Optional
 import logging
 
+import numpy as np
+
+from matplotlib import rcParams
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 from tkinter import ttk
 
 from core.orchestrator import AppOrchestrator
+from models.variant import boundary_value_getter
 
 logger = logging.getLogger(__name__)
 
+# Basis-Höhe des Dashboard-Diagramms in Zoll (wird je nach Materialanzahl erhöht)
+CHART_BASE_HEIGHT = 4.0
+
 
 class DashboardView(ctk.CTkFrame):
     """
@@ -35,12 +42,15 @@ class DashboardView(ctk.CTkFrame):
         self.orchestrator = orchestrator
         self.logger = logger
 
-        # Chart
+        # Chart (Figure/Canvas werden einmal erstellt und bei refresh neu gezeichnet)
         self.figure: Optional[Figure] = None
         self.canvas: Optional[FigureCanvasTkAgg] = None
+        self.vis_frame: Optional[ctk.CTkFrame] = None
+        self.table_frame: Optional[ctk.CTkFrame] = None
 
         # Checkboxen
         self.visibility_vars: list[ctk.BooleanVar] = []
+        self.visibility_checkboxes: list[ctk.CTkCheckBox] = []
 
         self._build_ui()
 
@@ -77,6 +87,7 @@ class DashboardView(ctk.CTkFrame):
         # Unterer Bereich: Sichtbarkeits-Checkboxen (fix unten)
         vis_frame = ctk.CTkFrame(self)
         vis_frame.pack(side="bottom", fill="x", padx=10, pady=10)
+        self.vis_frame = vis_frame
 
         # Varianten-Label
         vis_label = ctk.CTkLabel(
@@ -95,34 +106,51 @@ class DashboardView(ctk.CTkFrame):
         self._create_chart(chart_frame)
 
     def _create_visibility_checkboxes(self, parent: ctk.CTkFrame) -> None:
-        """Erstellt Checkboxen dynamisch für vorhandene Varianten"""
-        # Alte Checkboxen entfernen
-        self.visibility_vars.clear()
-        for widget in parent.winfo_children():
-            if isinstance(widget, ctk.CTkCheckBox):
-                widget.destroy()
-
-        # Neue Checkboxen für vorhandene Varianten erstellen
+        """
+        Erstellt/aktualisiert Checkboxen für vorhandene Varianten
+
+        Bestehende Checkboxen werden wiederverwendet (nur Text/Wert angepasst),
+        neue nur für hinzugekommene Varianten erstellt, überzählige entfernt.
+        """
         project = self.orchestrator.get_current_project()
+        variants = project.variants if project else []
+
         if project:
             # Sicherstellen, dass visible_variants genug Einträge hat
             while len(project.visible_variants) < len(project.variants):
                 project.visible_variants.append(True)
 
-            for i, variant in enumerate(project.variants):
-                # Wert aus project.visible_variants holen, nicht aus variant.visible
-                is_visible = project.visible_variants[i] if i < len(
-                    project.visible_variants) else True
-                var = ctk.BooleanVar(value=is_visible)
-                self.visibility_vars.append(var)
-
-                cb = ctk.CTkCheckBox(
-                    parent,
-                    text=variant.name,
-                    variable=var,
-                    command=self._on_visibility_changed
-                )
-                cb.pack(side="left", padx=10)
+        for i, variant in enumerate(variants):
+            # Wert aus project.visible_variants holen, nicht aus variant.visible
+            is_visible = project.visible_variants[i] if i < len(
+                project.visible_variants) else True
+
+            if i < len(self.visibility_checkboxes):
+                # Vorhandene Checkbox nur anpassen, wenn sich etwas geändert hat
+                cb = self.visibility_checkboxes[i]
+                var = self.visibility_vars[i]
+                if cb.cget("text") != variant.name:
+                    cb.configure(text=variant.name)
+                if var.get() != is_visible:
+                    var.set(is_visible)
+                continue
+
+            var = ctk.BooleanVar(value=is_visible)
+            self.visibility_vars.append(var)
+
+            cb = ctk.CTkCheckBox(
+                parent,
+                text=variant.name,
+                variable=var,
+                command=self._on_visibility_changed
+            )
+            cb.pack(side="left", padx=10)
+            self.visibility_checkboxes.append(cb)
+
+        # Checkboxen gelöschter Varianten entfernen
+        while len(self.visibility_checkboxes) > len(variants):
+            self.visibility_checkboxes.pop().destroy()
+            self.visibility_vars.pop()
 
     def _create_chart(self, parent: ctk.CTkFrame) -> None:
         """Erstellt Matplotlib-Chart mit Tabelle"""
@@ -131,28 +159,28 @@ class DashboardView(ctk.CTkFrame):
         plot_frame = ctk.CTkFrame(parent)
         plot_frame.pack(fill="both", expand=True, pady=(0, 10))
 
-        # Figure erstellen mit Theme
-        is_dark = ctk.get_appearance_mode() == "Dark"
-        fig_color = '#2b2b2b' if is_dark else 'white'
+        # DPI verdreifacht (300) und Größe auf 1/3 reduziert für höhere Auflösung
+        self.figure = Figure(figsize=(8, CHART_BASE_HEIGHT), dpi=100)
+        self._draw_chart()
 
-        # Figure-Größe dynamisch anpassen (mehr Höhe bei vielen Materialien)
-        project = self.orchestrator.get_current_project()
-        num_materials = 0
-        if project and project.variants:
-            all_materials = set()
-            for variant in project.variants:
-                for row in variant.rows:
-                    if row.material_name:
-                        all_materials.add(row.material_name)
-            num_materials = len(all_materials)
+        # Canvas erstellen
+        self.canvas = FigureCanvasTkAgg(self.figure, plot_frame)
+        self.canvas.draw()
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
-        # Höhe linear basierend auf Anzahl der Materialien
-        # Formel: Basis + (Anzahl Materialien × Faktor)
-        base_height = 4.0  # Basis-Höhe für wenige Materialien
+        # Unterer Teil: Material-Tabelle (eigener Container, wird bei refresh neu befüllt)
+        self.table_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        self.table_frame.pack(fill="x")
+        self._fill_material_table()
 
-        # DPI verdreifacht (300) und Größe auf 1/3 reduziert für höhere Auflösung
-        self.figure = Figure(figsize=(8, base_height),
-                             dpi=100, facecolor=fig_color)
+    def _draw_chart(self) -> None:
+        """Zeichnet das Diagramm in die bestehende Figure (ohne Canvas-Update)"""
+        # Figure mit Theme
+        is_dark = ctk.get_appearance_mode() == "Dark"
+        fig_color = '#2b2b2b' if is_dark else 'white'
+
+        self.figure.clear()
+        self.figure.set_facecolor(fig_color)
         ax = self.figure.add_subplot(111)
 
         if is_dark:
@@ -162,6 +190,7 @@ class DashboardView(ctk.CTkFrame):
         project = self.orchestrator.get_current_project()
 
         if not project or not project.variants:
+            self._reset_figure_layout()
             text_color = 'lightgray' if is_dark else 'gray'
             ax.text(
                 0.5, 0.5,
@@ -179,14 +208,31 @@ class DashboardView(ctk.CTkFrame):
             ax.set_ylabel('CO2-Äquivalent [t]', fontsize=14)
             ax.set_title('CO2-Bilanzierung - Variantenvergleich',
                          fontweight='bold', fontsize=15, pad=15)
-        # Canvas erstellen
-        self.canvas = FigureCanvasTkAgg(self.figure, plot_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
-        # Unterer Teil: Material-Tabelle
+    def _reset_figure_layout(self) -> None:
+        """
+        Setzt Höhe und Ränder der (wiederverwendeten) Figure auf die Ausgangswerte
+
+        Für Platzhalter-Texte ohne Diagramm - sonst blieben Höhe und
+        subplots_adjust-Ränder des letzten Diagramms erhalten.
+        """
+        w_in, _ = self.figure.get_size_inches()
+        self.figure.set_size_inches(w_in, CHART_BASE_HEIGHT, forward=True)
+        self.figure.subplots_adjust(
+            left=rcParams['figure.subplot.left'],
+            right=rcParams['figure.subplot.right'],
+            bottom=rcParams['figure.subplot.bottom'],
+            top=rcParams['figure.subplot.top'],
+        )
+
+    def _fill_material_table(self) -> None:
+        """Baut die Material-Tabellen im Tabellen-Container neu auf"""
+        for widget in self.table_frame.winfo_children():
+            widget.destroy()
+
+        project = self.orchestrator.get_current_project()
         if project and project.variants:
-            self._create_material_table(parent, project)
+            self._create_material_table(self.table_frame, project)
 
     def _plot_comparison(self, ax, project, is_dark: bool = False) -> None:
         """
@@ -207,39 +253,28 @@ class DashboardView(ctk.CTkFrame):
         # 2. Zentrale Farbzuordnung aktualisieren
         self.orchestrator.update_material_colors(visible_indices)
 
-        # 3. Alle Materialien über sichtbare Varianten sammeln (für num_materials)
-        all_materials = set()
+        # 3. Sichtbare Varianten in einem Durchlauf über die Zeilen sammeln
+        variant_names = []
+        variant_data = []  # Liste von Dictionaries {material_name: value}
+        get_value = boundary_value_getter(project.system_boundary)
+
         for i in visible_indices:
-            for row in project.variants[i].rows:
+            variant = project.variants[i]
+            variant_names.append(variant.name)
+            # Materialwerte sammeln (nach Systemgrenze), kg → t
+            # WICHTIG: Addiere Werte wenn Material mehrfach vorkommt
+            material_values = defaultdict(float)
+            for row in variant.rows:
                 if row.material_name:
-                    all_materials.add(row.material_name)
+                    material_values[row.material_name] += get_value(row) / 1000.0
+            variant_data.append(material_values)
 
+        # Alle Materialien über sichtbare Varianten (ohne zweiten Durchlauf der Zeilen)
+        all_materials = set().union(*variant_data)
         num_materials = len(all_materials)
 
-        # 3. Varianten sammeln - nur tatsächlich vorhandene Materialien
-        variant_names = []
-        variant_data = []  # Liste von Dictionaries {material_name: value}
-
-        for i, variant in enumerate(project.variants):
-            # Nur sichtbare Varianten berücksichtigen
-            if i < len(self.visibility_vars) and self.visibility_vars[i].get():
-                variant_names.append(variant.name)
-                # Materialwerte sammeln (nach Systemgrenze)
-                material_values = {}
-                for row in variant.rows:
-                    if row.material_name:
-                        val = self._get_value_for_boundary(
-                            row, project.system_boundary)
-                        # kg → t
-                        # WICHTIG: Addiere Werte wenn Material mehrfach vorkommt
-                        if row.material_name in material_values:
-                            material_values[row.material_name] += val / 1000.0
-                        else:
-                            material_values[row.material_name] = val / 1000.0
-
-                variant_data.append(material_values)
-
         if not variant_names:
+            self._reset_figure_layout()
             ax.text(
                 0.5, 0.5,
                 "Keine Varianten sichtbar",
@@ -253,40 +288,41 @@ class DashboardView(ctk.CTkFrame):
         # 4. Gestapeltes Balkendiagramm mit konsistenten Farben
         x_pos = range(len(variant_names))
 
-        # Für jede Variante: Iteriere durch ALLE Materialien (sortiert) für Konsistenz
-        for idx, (name, material_values) in enumerate(zip(variant_names, variant_data)):
-            bottom_positive = 0  # Für positive Werte
-            bottom_negative = 0  # Für negative Werte
-            # WICHTIG: Iteriere durch ALLE Materialien in sortierter Reihenfolge
-            for material_name in sorted(all_materials):
-                # Hole Wert (0 wenn nicht vorhanden)
-                value = material_values.get(material_name, 0.0)
-                if value != 0:  # Zeichne positive UND negative Werte
-                    color = self.orchestrator.get_material_color(material_name)
-                    if value > 0:
-                        # Positive Werte von unten nach oben stapeln
-                        ax.bar(
-                            idx,
-                            value,
-                            bottom=bottom_positive,
-                            color=color,
-                            edgecolor='white',
-                            linewidth=0.5,
-                            width=0.6
-                        )
-                        bottom_positive += value
-                    else:
-                        # Negative Werte von oben nach unten stapeln
-                        ax.bar(
-                            idx,
-                            value,
-                            bottom=bottom_negative,
-                            color=color,
-                            edgecolor='white',
-                            linewidth=0.5,
-                            width=0.6
-                        )
-                        bottom_negative += value
+        # Materialien einmal sortieren und Farben einmal auflösen (Balken + Legende)
+        sorted_materials = sorted(all_materials)
+        color_map = {m: self.orchestrator.get_material_color(m) for m in sorted_materials}
+
+        # Werte-Matrix Materialien x Varianten (fehlende Materialien = 0)
+        material_index = {m: i for i, m in enumerate(sorted_materials)}
+        values = np.zeros((num_materials, len(variant_names)))
+        for v_idx, material_values in enumerate(variant_data):
+            for material_name, value in material_values.items():
+                values[material_index[material_name], v_idx] = value
+
+        # Ein ax.bar-Aufruf pro Material über alle Varianten (statt pro Variante
+        # und Material). Materialien in sortierter Reihenfolge stapeln: positive
+        # Werte von unten nach oben, negative von oben nach unten.
+        bottom_positive = np.zeros(len(variant_names))
+        bottom_negative = np.zeros(len(variant_names))
+        for mi, material_name in enumerate(sorted_materials):
+            row = values[mi]
+            # Nullwerte auslassen (sonst weiße Kante als Linie sichtbar)
+            nonzero = np.flatnonzero(row)
+            if nonzero.size == 0:
+                continue
+            heights = row[nonzero]
+            positive = heights > 0
+            ax.bar(
+                nonzero,
+                heights,
+                bottom=np.where(positive, bottom_positive[nonzero], bottom_negative[nonzero]),
+                color=color_map[material_name],
+                edgecolor='white',
+                linewidth=0.5,
+                width=0.6
+            )
+            bottom_positive[nonzero] += np.where(positive, heights, 0.0)
+            bottom_negative[nonzero] += np.where(positive, 0.0, heights)
 
         # 5. Achsenbeschriftung mit dynamischer Rotation
         ax.set_xticks(x_pos)
@@ -322,9 +358,8 @@ class DashboardView(ctk.CTkFrame):
             # Erstelle Patches für alle Materialien (sortiert)
             legend_handles = []
             legend_labels = []
-            for material_name in sorted(all_materials):
-                color = self.orchestrator.get_material_color(material_name)
-                patch = Rectangle((0, 0), 1, 1, fc=color, edgecolor='white')
+            for material_name in sorted_materials:
+                patch = Rectangle((0, 0), 1, 1, fc=color_map[material_name], edgecolor='white')
                 legend_handles.append(patch)
                 # Kürze zu lange Namen für bessere Lesbarkeit
                 display_name = material_name if len(
@@ -459,6 +494,9 @@ class DashboardView(ctk.CTkFrame):
         if not visible_variants:
             return
 
+        # Systemgrenze einmal auflösen (nicht pro Zeile)
+        get_value = boundary_value_getter(project.system_boundary)
+
         # Font-Konfigurationen für Tabellen
         header_font = ("Helvetica", 11, "bold")    # Header-Schrift
         content_font = ("Helvetica", 10)            # Inhalts-Schrift
@@ -557,8 +595,7 @@ class DashboardView(ctk.CTkFrame):
             variant_total = 0
             for row in variant.rows:
                 if row.material_name:
-                    val = self._get_value_for_boundary(
-                        row, project.system_boundary)
+                    val = get_value(row)
                     val_tons = val / 1000.0  # kg → t
                     tree.insert("", "end", values=(
                         row.material_name,  # Voller Name, kein Kürzen
@@ -579,32 +616,8 @@ class DashboardView(ctk.CTkFrame):
 
             tree.pack(fill="both", expand=True, padx=5, pady=(0, 5))
 
-    def _get_value_for_boundary(self, row, boundary: str) -> float:
-        """Gibt Wert für Systemgrenze zurück (Standard oder bio-korrigiert)"""
-        # Standard-Deklaration (EN 15804+A2)
-        if boundary == "A1-A3":
-            return row.result_a
-        elif boundary == "A1-A3 + C3 + C4":
-            return row.result_ac
-        elif boundary == "A1-A3 + C3 + C4 + D":
-            return row.result_acd if row.result_acd is not None else row.result_ac
-        # Bio-korrigierte Varianten
-        elif boundary == "A1-A3 (bio)":
-            return row.result_a_bio if row.result_a_bio is not None else row.result_a
-        elif boundary == "A1-A3 + C3 + C4 (bio)":
-            return row.result_ac_bio if row.result_ac_bio is not None else row.result_ac
-        elif boundary == "A1-A3 + C3 + C4 + D (bio)":
-            if row.result_acd_bio is not None:
-                return row.result_acd_bio
-            elif row.result_acd is not None:
-                return row.result_acd
-            else:
-                return row.result_ac_bio if row.result_ac_bio is not None else row.result_ac
-        # Fallback
-        return row.result_a
-
     def refresh(self) -> None:
-        """Aktualisiert Dashboard"""
+        """Aktualisiert Dashboard (zeichnet in die bestehende Figure, kein neues Canvas)"""
         # Prüfen, ob Widget noch existiert
         try:
             if not self.winfo_exists():
@@ -612,28 +625,17 @@ class DashboardView(ctk.CTkFrame):
         except:
             return
 
-        children = self.winfo_children()
-
-        # Checkboxen aktualisieren (letztes Kind-Widget: vis_frame mit side=bottom)
-        try:
-            if len(children) > 1:
-                vis_frame = children[-1]  # Letztes Element (side=bottom)
-                self._create_visibility_checkboxes(vis_frame)
-        except:
-            pass
-
-        # Chart neu zeichnen (vorletztes Kind-Widget: chart_frame)
+        # Checkboxen aktualisieren
         try:
-            if self.canvas:
-                self.canvas.get_tk_widget().destroy()
-                self.canvas = None
+            self._create_visibility_checkboxes(self.vis_frame)
         except:
             pass
 
+        # Chart neu zeichnen und Tabellen neu befüllen
         try:
-            if len(children) > 1:
-                chart_frame = children[-2]  # Vorletztes Element
-                self._create_chart(chart_frame)
+            self._draw_chart()
+            self.canvas.draw_idle()
+            self._fill_material_table()
         except Exception as e:
             self.logger.error(f"Fehler beim Aktualisieren des Dashboards: {e}")
 
@@ -15,7 +15,7 @@ from tkinter import filedialog, messagebox, scrolledtext
 import logging
 from pathlib import Path
 
-from services.pdf import PDFExporterPro, ExportConfig, InfoBlock, PREDEFINED_INFO_BLOCKS
+from services.pdf import PDFExporterPro, ExportConfig, InfoBlock, PREDEFINED_INFO_BLOCKS, get_predefined_info_block
 from services.pdf.pdf_charts import PDFChartCreator
 from services.excel_export import ExcelExporter
 from models.project import Project
@@ -447,7 +447,7 @@ class ExportDialogPro(ctk.CTkToplevel):
             # Info-Blöcke
             for block_id, var in self.info_block_checkboxes.items():
                 if var.get():
-                    info_block = PREDEFINED_INFO_BLOCKS[block_id].copy()
+                    info_block = get_predefined_info_block(block_id)
                     info_block.include = True
                     config.add_info_block(info_block)
 
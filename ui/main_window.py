@@ -15,7 +15,6 @@ from core.orchestrator import AppOrchestrator
 from ui.project_tree import ProjectTreeView
 from ui.dashboard.dashboard_view import DashboardView
 from ui.variants.variant_view import VariantView
-from ui.dialogs.export_dialog_pro import ExportDialogPro
 
 logger = logging.getLogger(__name__)
 
@@ -422,6 +421,9 @@ class MainWindow(ctk.CTk):
 
     def _show_export_menu(self) -> None:
         """Zeigt professionellen Export-Dialog"""
+        # Erst hier importieren: lädt ReportLab/PDF-Export nur bei Bedarf (nicht beim Start)
+        from ui.dialogs.export_dialog_pro import ExportDialogPro
+
         project = self.orchestrator.get_current_project()
         if not project:
             messagebox.showwarning(
@@ -9,9 +9,9 @@ import logging
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 
 from core.orchestrator import AppOrchestrator
+from models.variant import boundary_value_getter
 from ui.dialogs.material_picker import MaterialPickerDialog
 
 logger = logging.getLogger(__name__)
@@ -121,35 +121,13 @@ class VariantView(ctk.CTkFrame):
         self.orchestrator.update_material_colors([self.variant_index])
 
         # Daten sammeln - aggregiere doppelte Materialien
+        # Systemgrenze einmal auflösen (nicht pro Zeile)
+        get_value = boundary_value_getter(boundary)
         material_values = {}
 
         for row in variant.rows:
             if row.material_name:
-                # Wert abhängig von boundary bestimmen
-                if boundary == "A1-A3":
-                    value = row.result_a / 1000.0  # kg → t
-                elif boundary == "A1-A3 + C3 + C4":
-                    value = row.result_ac / 1000.0  # kg → t
-                elif boundary == "A1-A3 + C3 + C4 + D":
-                    val = row.result_acd if row.result_acd is not None else row.result_ac
-                    value = val / 1000.0  # kg → t
-                # Bio-korrigierte Varianten
-                elif boundary == "A1-A3 (bio)":
-                    val = row.result_a_bio if row.result_a_bio is not None else row.result_a
-                    value = val / 1000.0  # kg → t
-                elif boundary == "A1-A3 + C3 + C4 (bio)":
-                    val = row.result_ac_bio if row.result_ac_bio is not None else row.result_ac
-                    value = val / 1000.0  # kg → t
-                elif boundary == "A1-A3 + C3 + C4 + D (bio)":
-                    if row.result_acd_bio is not None:
-                        val = row.result_acd_bio
-                    elif row.result_acd is not None:
-                        val = row.result_acd
-                    else:
-                        val = row.result_ac_bio if row.result_ac_bio is not None else row.result_ac
-                    value = val / 1000.0  # kg → t
-                else:
-                    value = row.result_a / 1000.0  # kg → t
+                value = get_value(row) / 1000.0  # kg → t
 
                 # Addiere Werte wenn Material mehrfach vorkommt
                 if row.material_name in material_values:
@@ -168,6 +146,9 @@ class VariantView(ctk.CTkFrame):
                     ha='center', va='center', color=text_color)
             ax.axis('off')
         else:
+            # Farben einmal pro Material auflösen (Balken + Legende)
+            color_map = {label: self.orchestrator.get_material_color(label) for label in labels}
+
             # Gestapeltes Balkendiagramm (VERTIKAL - positive oben, negative unten)
             bottom_positive = 0  # Für positive Werte (nach oben)
             bottom_negative = 0  # Für negative Werte (nach unten)
@@ -177,7 +158,7 @@ class VariantView(ctk.CTkFrame):
                     continue  # Überspringe Nullwerte
 
                 # Verwende zentrale Farbzuordnung
-                color = self.orchestrator.get_material_color(label)
+                color = color_map[label]
 
                 if value > 0:
                     # Positive Werte von 0 nach oben stapeln
@@ -218,9 +199,9 @@ class VariantView(ctk.CTkFrame):
             from matplotlib.patches import Rectangle
             legend_handles = []
             legend_labels = []
-            for material_name in sorted(labels):
-                color = self.orchestrator.get_material_color(material_name)
-                patch = Rectangle((0, 0), 1, 1, fc=color, edgecolor='white')
+            # labels ist bereits alphabetisch sortiert
+            for material_name in labels:
+                patch = Rectangle((0, 0), 1, 1, fc=color_map[material_name], edgecolor='white')
                 legend_handles.append(patch)
                 legend_labels.append(material_name)
 